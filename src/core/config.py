@@ -20,7 +20,7 @@ class TelegramConfig:
     """Telegram bot connection and authorization settings."""
 
     bot_token: str
-    authorized_users: list[int]
+    authorized_users: frozenset[int]
     edit_rate_limit: int = 3
 
 
@@ -129,7 +129,7 @@ def load_config(path: str) -> AppConfig:
     return AppConfig(
         telegram=TelegramConfig(
             bot_token=telegram_raw["bot_token"],
-            authorized_users=telegram_raw["authorized_users"],
+            authorized_users=frozenset(telegram_raw["authorized_users"]),
             edit_rate_limit=telegram_raw.get("edit_rate_limit", 3),
         ),
         projects=ProjectsConfig(
@@ -34,7 +34,7 @@ from src.telegram.handlers import (
 )
 from src.telegram.keyboards import BOT_COMMANDS
 from src.telegram.output import poll_output
-from src.core.config import load_config
+from src.core.config import AppConfig, load_config
 from src.core.database import Database
 from src.file_handler import FileHandler
 from src.core.log_setup import setup_logging
@@ -44,7 +44,11 @@ logger = logging.getLogger(__name__)
 
 
 def build_app(config_path: str, debug: bool = False, trace: bool = False, verbose: bool = False) -> Application:
-    """Build and configure the Telegram bot application."""
+    """Build and configure the Telegram bot application from a YAML file.
+
+    Loads *config_path*, applies the command-line debug flags on top of it,
+    and delegates the wiring to :func:`build_app_from_config`.
+    """
     config = load_config(config_path)
 
     if debug:
@@ -54,6 +58,11 @@ def build_app(config_path: str, debug: bool = False, trace: bool = False, verbos
     if verbose:
         config.debug.verbose = True
 
+    return build_app_from_config(config)
+
+
+def build_app_from_config(config: AppConfig) -> Application:
+    """Build and configure the Telegram bot application from a loaded config."""
     app = Application.builder().token(config.telegram.bot_token).build()
 
     db = Database(config.database.path)
@@ -130,7 +139,7 @@ async def _on_startup(app: Application) -> None:
         f"Host: <code>{html_mod.escape(hostname)}</code>"
         f"{stale_info}"
     )
-    for user_id in config.telegram.authorized_users:
+    for user_id in sorted(config.telegram.authorized_users):
         try:
             await app.bot.send_message(
                 chat_id=user_id, text=text, parse_mode="HTML",
@@ -152,7 +161,7 @@ async def _send_shutdown_message(bot, config, session_manager) -> None:
     )
     active_info = f"\nActive sessions: {active_count} (ending)" if active_count else ""
     text = f"<b>Bot shutting down</b>{active_info}"
-    for user_id in config.telegram.authorized_users:
+    for user_id in sorted(config.telegram.authorized_users):
         try:
             await bot.send_message(
                 chat_id=user_id, text=text, parse_mode="HTML",
@@ -25,7 +25,7 @@ class ScreenState(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScreenEvent:
     """Classified screen state with extracted payload and raw lines."""
 
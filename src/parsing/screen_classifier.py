@@ -42,6 +42,28 @@ from src.parsing.ui_patterns import (
 
 logger = logging.getLogger(__name__)
 
+# UI chrome that the bottom-up scan skips over, merged into one alternation
+# so each line costs a single search instead of one per pattern.  The
+# ^-anchored members keep their .match() semantics under .search().
+_SKIPPED_CHROME_RE = re.compile(
+    "|".join(
+        f"(?:{r.pattern})"
+        for r in (
+            STATUS_BAR_RE,
+            SEPARATOR_RE,
+            SEPARATOR_PREFIX_RE,
+            TIP_RE,
+            BARE_TIME_RE,
+            CLAUDE_HINT_RE,
+            TIMER_RE,
+            EXTRA_BASH_RE,
+            EXTRA_AGENTS_RE,
+            EXTRA_FILES_RE,
+            PR_INDICATOR_RE,
+        )
+    )
+)
+
 
 def _extract_tool_info(lines: list[str]) -> dict:
     """Extract tool name and target from screen lines.
@@ -146,20 +168,7 @@ def classify_screen_state(
     active_idx = len(lines) - 1
     while active_idx >= 0:
         stripped = lines[active_idx].strip()
-        if (
-            stripped
-            and not STATUS_BAR_RE.search(stripped)
-            and not SEPARATOR_RE.match(stripped)
-            and not SEPARATOR_PREFIX_RE.match(stripped)
-            and not TIP_RE.match(stripped)
-            and not BARE_TIME_RE.match(stripped)
-            and not CLAUDE_HINT_RE.search(stripped)
-            and not TIMER_RE.search(stripped)
-            and not EXTRA_BASH_RE.search(stripped)
-            and not EXTRA_AGENTS_RE.search(stripped)
-            and not EXTRA_FILES_RE.search(stripped)
-            and not PR_INDICATOR_RE.match(stripped)
-        ):
+        if stripped and not _SKIPPED_CHROME_RE.search(stripped):
             break
         active_idx -= 1
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import re
 import textwrap
+from collections.abc import Iterable, Iterator
 
 from src.parsing.models import ScreenEvent, ScreenState  # noqa: F401 — re-exported
 
@@ -68,6 +71,8 @@ BACKGROUND_RE = re.compile(r"in the background")
 # Parallel agents
 AGENTS_LAUNCHED_RE = re.compile(r"(\d+) agents? launched")
 AGENT_TREE_ITEM_RE = re.compile(r"^\s*[├└]\s*─\s*(.*)")
+# Line-level agent tree check: text must follow the dash (not a pure border)
+AGENT_TREE_LINE_RE = re.compile(r"^[├└]\s*─+\s+\w")
 AGENT_COMPLETE_RE = re.compile(r'Agent "(.+?)" completed')
 LOCAL_AGENTS_RE = re.compile(r"(\d+) local agents?")
 
@@ -102,12 +107,41 @@ EXTRA_BASH_RE = re.compile(r"(\d+) bash")
 EXTRA_AGENTS_RE = re.compile(r"(\d+) local agents?")
 EXTRA_FILES_RE = re.compile(r"(\d+) files? \+(\d+) -(\d+)")
 
+# Single-pass dispatcher for the text-based status bar checks in
+# classify_text_line.  All alternatives map to "status_bar", so their order
+# is irrelevant.  EXTRA_FILES_RE ("N files? +N -N") has a format specific
+# enough not to appear in prose.
+_STATUS_BAR_LINE_RE = re.compile("|".join(
+    f"(?:{pattern.pattern})"
+    for pattern in (
+        TIP_RE, BARE_TIME_RE, CLAUDE_HINT_RE, PR_INDICATOR_RE,
+        EXTRA_FILES_RE, CONTEXT_TIMER_RE,
+    )
+))
+
+# Deletion tables for pure character-class checks.  ``str.translate`` walks
+# the line once in C; an empty remainder means every char was in the class.
+_SEPARATOR_TABLE = str.maketrans("", "", "─━═")
+_DIFF_DELIMITER_TABLE = str.maketrans("", "", "╌")
+_PROGRESS_BAR_TABLE = str.maketrans("", "", "▊▉█▌▍▎▏░▒▓")
+_BOX_CHAR_TABLE = str.maketrans("", "", "╭╮╰╯│├┤┬┴┼┌┐└┘")
+_LOGO_TABLE = str.maketrans("", "", "▐▛▜▌▝▘█▞▚")
+
 CHROME_CATEGORIES = frozenset({
     "separator", "diff_delimiter", "status_bar", "prompt",
     "thinking", "startup", "logo", "box", "empty",
 })
 
+# Line categories that end a ❯ prompt's wrapped-input continuation
+PROMPT_END_CATEGORIES = frozenset({
+    "response", "tool_connector", "tool_header", "thinking", "separator",
+})
+
+# Line categories that carry Claude's output and survive extract_content
+_EXTRACTED_CATEGORIES = frozenset({"content", "response", "tool_connector"})
 
+
+@functools.lru_cache(maxsize=4096)
 def classify_text_line(line: str) -> str:
     """Classify a screen line as a UI element or content.
 
@@ -115,6 +149,10 @@ def classify_text_line(line: str) -> str:
     status bars, thinking indicators, tool headers, etc.) and returns a
     category string.
 
+    Results are memoized: the function is pure (one ``str`` in, one
+    category literal out) and chrome lines such as separators, status bars
+    and the prompt repeat verbatim across every poll cycle.
+
     Args:
         line: A single terminal screen line to classify.
 
@@ -128,13 +166,28 @@ def classify_text_line(line: str) -> str:
     stripped = line.strip()
     if not stripped:
         return "empty"
-    if SEPARATOR_RE.match(stripped):
-        return "separator"
+    # ASCII fast path: every sigil, rule, box and block-element character
+    # below is non-ASCII (as is the │ the status bar regex needs), so plain
+    # text lines can only hit the text-based checks.
+    if stripped.isascii():
+        if STARTUP_RE.search(stripped):
+            return "startup"
+        if _STATUS_BAR_LINE_RE.search(stripped):
+            return "status_bar"
+        if TOOL_HEADER_LINE_RE.match(stripped):
+            return "tool_header"
+        return "content"
+    # Pure separator / diff delimiter: 4+ rule chars, optionally followed by
+    # pyte's trailing U+FFFD (same rules as SEPARATOR_RE / DIFF_DELIMITER_RE).
+    rule = stripped.rstrip("\uFFFD")
+    if len(rule) >= 4:
+        if not rule.translate(_SEPARATOR_TABLE):
+            return "separator"
+        if not rule.translate(_DIFF_DELIMITER_TABLE):
+            return "diff_delimiter"
     # Separator with trailing text overlay (pyte bleed from adjacent columns)
     if SEPARATOR_PREFIX_RE.match(stripped):
         return "separator"
-    if DIFF_DELIMITER_RE.match(stripped):
-        return "diff_delimiter"
     # Startup banner line (e.g. "Claude Code v2.1.39") — must be filtered
     # to prevent leaking into response content when pyte redraws the screen.
     if STARTUP_RE.search(stripped):
@@ -143,31 +196,21 @@ def classify_text_line(line: str) -> str:
     # to avoid false positives on table data rows containing │
     if ("⎇" in stripped or "Usage:" in stripped) and STATUS_BAR_RE.search(stripped):
         return "status_bar"
-    # Tip/hint lines from Claude Code UI
-    if TIP_RE.match(stripped):
+    # Tip/hint lines, bare clock, `claude --resume` hint, standalone PR
+    # indicator, "N files +N -N" counters and the ↻ context timer — one
+    # regex pass over _STATUS_BAR_LINE_RE instead of six separate calls.
+    if _STATUS_BAR_LINE_RE.search(stripped):
         return "status_bar"
-    if BARE_TIME_RE.match(stripped):
-        return "status_bar"
-    if CLAUDE_HINT_RE.search(stripped):
-        return "status_bar"
-    if PR_INDICATOR_RE.match(stripped):
-        return "status_bar"
-    # Extra status line: "4 files +0 -0 · PR #5", "1 bash · 1 file +194 -192"
-    # These are Claude Code's bottom-row status counters.  EXTRA_FILES_RE
-    # has a very specific format (N files? +N -N) that doesn't appear in prose.
+    # Extra status line: "4 local agents · 1 file +194 -192", "1 bash · …".
     # EXTRA_BASH_RE / EXTRA_AGENTS_RE require a · separator to avoid false
     # positives on prose containing "bash" or "local agents".
-    if EXTRA_FILES_RE.search(stripped):
-        return "status_bar"
     if "\u00b7" in stripped and (
         EXTRA_BASH_RE.search(stripped)
         or EXTRA_AGENTS_RE.search(stripped)
     ):
         return "status_bar"
-    # Context window progress bar and/or timer (e.g. "▊░░░░░░░░░ ↻ 11:00")
-    if CONTEXT_TIMER_RE.search(stripped):
-        return "status_bar"
-    if PROGRESS_BAR_RE.match(stripped):
+    # Context window progress bar alone (e.g. "▊▊▊░░░░░░░")
+    if not stripped.translate(_PROGRESS_BAR_TABLE).strip():
         return "status_bar"
     if THINKING_STAR_RE.match(stripped):
         return "thinking"
@@ -180,7 +223,7 @@ def classify_text_line(line: str) -> str:
     if TODO_ITEM_RE.match(stripped):
         return "todo_item"
     # Agent tree: ├─ name or └─ name (must have text after dash, not pure border)
-    if re.match(r"^[├└]\s*─+\s+\w", stripped):
+    if AGENT_TREE_LINE_RE.match(stripped):
         return "agent_tree"
     if PROMPT_MARKER_RE.match(stripped):
         return "prompt"
@@ -189,14 +232,14 @@ def classify_text_line(line: str) -> str:
     # Lines with substantial alphabetic content between box chars are table
     # data rows from Claude's response — keep those as "content".
     if BOX_CHAR_RE.search(stripped) and len(stripped) > 10:
-        box_chars = sum(1 for c in stripped if BOX_CHAR_RE.match(c))
+        box_chars = len(stripped) - len(stripped.translate(_BOX_CHAR_TABLE))
         if box_chars >= 2:
             alpha_chars = sum(1 for c in stripped if c.isalpha())
             if alpha_chars <= 3:
                 return "box"
     # Require 3+ block-element chars to distinguish logo from occasional Unicode in content
     if LOGO_RE.search(stripped):
-        logo_chars = sum(1 for c in stripped if LOGO_RE.match(c))
+        logo_chars = len(stripped) - len(stripped.translate(_LOGO_TABLE))
         if logo_chars >= 3:
             return "logo"
     return "content"
@@ -224,48 +267,51 @@ def extract_content(lines: list[str]) -> str:
         Newline-joined string of content lines with common margin removed
         but relative indentation preserved.
     """
-    content_lines = []
+    categories = list(map(classify_text_line, lines))
+    keep = []
     in_prompt = False
-    for line in lines:
-        cls = classify_text_line(line)
-        # Start skipping after a ❯ prompt line — continuation lines
-        # (wrapped user input) are classified as 'content' but belong
-        # to the prompt, not to Claude's response.
+    for cls in categories:
         if cls == "prompt":
+            # Start skipping after a ❯ prompt line — continuation lines
+            # (wrapped user input) are classified as 'content' but belong
+            # to the prompt, not to Claude's response.
             in_prompt = True
-            continue
-        # End prompt continuation when we hit a response marker or
-        # another structured element that signals Claude's output.
-        if in_prompt:
-            if cls in (
-                "response", "tool_connector", "tool_header",
-                "thinking", "separator",
-            ):
-                in_prompt = False
-            else:
-                # Still in prompt continuation — skip this line.
-                continue
-        if cls == "content":
-            # Preserve leading whitespace (indentation); strip only trailing.
-            content_lines.append(line.rstrip())
-        elif cls == "response":
-            # ⏺ lines carry Claude's response text — replace the marker
-            # with spaces to preserve column alignment for dedent.
-            replaced = re.sub(
-                r"⏺\s?", lambda m: " " * len(m.group(0)), line, count=1,
-            )
-            if replaced.strip():
-                content_lines.append(replaced.rstrip())
-        elif cls == "tool_connector":
-            # ⎿ lines carry tool output (file contents, command results).
-            # Replace the connector prefix with spaces to preserve alignment.
-            replaced = re.sub(
-                r"⎿\s*", lambda m: " " * len(m.group(0)), line, count=1,
-            )
-            if replaced.strip():
-                content_lines.append(replaced.rstrip())
+        elif in_prompt and cls in PROMPT_END_CATEGORIES:
+            # End prompt continuation when we hit a response marker or
+            # another structured element that signals Claude's output.
+            in_prompt = False
+        keep.append(not in_prompt and cls in _EXTRACTED_CATEGORIES)
+
     # Remove common leading whitespace (terminal margin) while
     # preserving relative indentation (e.g. Python code structure).
-    joined = "\n".join(content_lines)
+    joined = "\n".join(
+        _render_content_lines(itertools.compress(zip(lines, categories), keep))
+    )
     dedented = textwrap.dedent(joined)
     return dedented.strip()
+
+
+def _render_content_lines(kept: Iterable[tuple[str, str]]) -> Iterator[str]:
+    """Yield the output text of each kept ``(line, category)`` pair.
+
+    Trailing whitespace is stripped; marker-only lines that are blank once
+    their ⏺ / ⎿ marker is replaced are dropped.
+    """
+    for line, cls in kept:
+        if cls == "content":
+            # Preserve leading whitespace (indentation); strip only trailing.
+            yield line.rstrip()
+            continue
+        # ⏺ lines carry Claude's response text (marker + one space), ⎿ lines
+        # carry tool output (connector + all following whitespace).  The
+        # marker is replaced with spaces to preserve column alignment for
+        # dedent.
+        if cls == "response":
+            head, _, tail = line.partition("⏺")
+            rest = tail[1:] if tail[:1].isspace() else tail
+        else:
+            head, _, tail = line.partition("⎿")
+            rest = tail.lstrip()
+        replaced = head + " " * (len(line) - len(head) - len(rest)) + rest
+        if replaced.strip():
+            yield replaced.rstrip()
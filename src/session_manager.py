@@ -247,9 +247,14 @@ class OutputBuffer:
     def append(self, text: str) -> None:
         """Add text to the internal buffer and reset the debounce timer.
 
+        Empty fragments are ignored so a quiet poll does not postpone the
+        flush of output already buffered.
+
         Args:
             text: Output fragment to accumulate.
         """
+        if not text:
+            return
         self._buffer += text
         self._last_append = time.monotonic()
         logger.log(TRACE, "OutputBuffer append len=%d total=%d", len(text), len(self._buffer))
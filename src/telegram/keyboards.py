@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import functools
 import html
+import re
+from collections.abc import Container
 
 
 # --- Auth ---
 
 
-def is_authorized(user_id: int, authorized_users: list[int]) -> bool:
+def is_authorized(user_id: int, authorized_users: Container[int]) -> bool:
     """Check whether a Telegram user is allowed to interact with the bot."""
     return user_id in authorized_users
 
@@ -37,11 +40,10 @@ def build_project_keyboard(
 
     start = page * page_size
     end = start + page_size
-    page_projects = projects[start:end]
-
-    rows = []
-    for proj in page_projects:
-        rows.append([{"text": proj.name, "callback_data": f"project:{proj.path}"}])
+    rows = [
+        [{"text": proj.name, "callback_data": f"project:{proj.path}"}]
+        for proj in projects[start:end]
+    ]
 
     nav = []
     if page > 0:
@@ -171,29 +173,25 @@ def format_session_ended(project_name: str, session_id: int) -> str:
     return f"Session #{session_id} on <b>{safe_name}</b> ended."
 
 
+# Date and HH:MM of an ISO-8601 timestamp; seconds, fraction and offset ignored
+_TIMESTAMP_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2})")
+
+
 def _format_timestamp(raw: str) -> str:
     """Convert a raw ISO timestamp to a short human-readable format.
 
-    Strips microseconds and timezone offset, returning ``YYYY-MM-DD HH:MM``.
+    Keeps only the date and ``HH:MM``, dropping seconds, microseconds and
+    any timezone suffix (``+00:00``, ``-05:00``, ``Z``) in a single match.
 
     Args:
         raw: An ISO-8601 timestamp string (e.g. from the database).
 
     Returns:
-        A short date-time string like ``2026-02-11 22:02``.
+        A short date-time string like ``2026-02-11 22:02``, or *raw*
+        unchanged if it does not start with a date and time.
     """
-    # Strip microseconds (.123456) and timezone (+00:00 / Z)
-    clean = raw.split(".")[0].replace("T", " ")
-    # Remove trailing timezone offset if present (e.g. +00:00)
-    if "+" in clean:
-        clean = clean.split("+")[0]
-    elif clean.endswith("Z"):
-        clean = clean[:-1]
-    # Truncate to minutes (drop :SS) only when seconds are present
-    # A time like "10:02:35" has 2 colons; "10:02" has 1 colon
-    if clean.count(":") >= 2:
-        clean = clean.rsplit(":", 1)[0]
-    return clean
+    match = _TIMESTAMP_RE.match(raw)
+    return f"{match[1]} {match[2]}" if match else raw
 
 
 _STATUS_EMOJI = {"active": "🟢", "ended": "⚪", "lost": "🟡"}
@@ -212,20 +210,36 @@ def format_history_entry(entry: dict) -> str:
     Returns:
         A multi-line HTML-formatted string representing the history entry.
     """
-    safe_name = html.escape(entry["project"])
-    started = _format_timestamp(entry["started_at"])
-    emoji = _STATUS_EMOJI.get(entry["status"], "⚪")
-    sid = entry.get("id", "?")
+    return _render_history_entry(
+        entry.get("id", "?"),
+        entry["project"],
+        entry["started_at"],
+        entry.get("ended_at"),
+        entry["status"],
+        entry.get("exit_code"),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _render_history_entry(
+    sid: int | str, project: str, started_at: str, ended_at: str | None,
+    status: str, exit_code: int | None,
+) -> str:
+    """Render a history entry from its field values.
+
+    Cached because finished sessions never change, so repeat ``/history``
+    views re-render the same rows.
+    """
+    emoji = _STATUS_EMOJI.get(status, "⚪")
     parts = [
-        f"{emoji} <b>#{sid} {safe_name}</b>",
-        f"  Started: {html.escape(started)}",
+        f"{emoji} <b>#{sid} {html.escape(project)}</b>",
+        f"  Started: {html.escape(_format_timestamp(started_at))}",
     ]
-    if entry.get("ended_at"):
-        ended = _format_timestamp(entry["ended_at"])
-        parts.append(f"  Ended: {html.escape(ended)}")
-    parts.append(f"  Status: {html.escape(entry['status'])}")
-    if entry.get("exit_code") is not None:
-        parts.append(f"  Exit code: {entry['exit_code']}")
+    if ended_at:
+        parts.append(f"  Ended: {html.escape(_format_timestamp(ended_at))}")
+    parts.append(f"  Status: {html.escape(status)}")
+    if exit_code is not None:
+        parts.append(f"  Exit code: {exit_code}")
     return "\n".join(parts)
 
 
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from src.parsing.content_classifier import classify_regions
 from src.parsing.terminal_emulator import CharSpan
-from src.parsing.ui_patterns import classify_text_line
+from src.parsing.ui_patterns import PROMPT_END_CATEGORIES, classify_text_line
 from src.telegram.formatter import (
     format_html, reflow_text, render_regions, wrap_code_blocks,
 )
@@ -113,27 +113,28 @@ def dedent_attr_lines(
         Dedented span lists with common leading whitespace removed.
     """
     _skip = skip_indices or set()
-    min_indent = float("inf")
-    for i, spans in enumerate(lines):
-        if i in _skip:
-            continue
-        text = "".join(s.text for s in spans)
-        lstripped = text.lstrip()
-        if lstripped:
-            indent = len(text) - len(lstripped)
-            min_indent = min(min_indent, indent)
-    if min_indent in (0, float("inf")):
-        return lines
-    result: list[list[CharSpan]] = []
+    # Leading-space count per line (None for blank lines), computed once
+    # and reused for both the minimum and the stripping pass.
+    indents: list[int | None] = []
     for spans in lines:
         text = "".join(s.text for s in spans)
         lstripped = text.lstrip()
-        indent = (len(text) - len(lstripped)) if lstripped else 0
-        if indent >= min_indent:
-            result.append(lstrip_n_chars(spans, min_indent))
-        else:
-            result.append(spans)
-    return result
+        indents.append(len(text) - len(lstripped) if lstripped else None)
+    min_indent = min(
+        (
+            indent for i, indent in enumerate(indents)
+            if indent is not None and i not in _skip
+        ),
+        default=0,
+    )
+    if not min_indent:
+        return lines
+    return [
+        lstrip_n_chars(spans, min_indent)
+        if indent is not None and indent >= min_indent
+        else spans
+        for spans, indent in zip(lines, indents)
+    ]
 
 
 def filter_response_attr(
@@ -166,10 +167,7 @@ def filter_response_attr(
             in_prompt = True
             continue
         if in_prompt:
-            if cls in (
-                "response", "tool_connector", "tool_header",
-                "thinking", "separator",
-            ):
+            if cls in PROMPT_END_CATEGORIES:
                 in_prompt = False
             else:
                 continue
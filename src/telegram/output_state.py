@@ -52,10 +52,7 @@ class ContentDeduplicator:
         Args:
             display: Full terminal display lines.
         """
-        for line in display:
-            stripped = line.strip()
-            if stripped:
-                self.sent_lines.add(stripped)
+        self.sent_lines.update(filter(None, map(str.strip, display)))
 
     def snapshot_chrome(self, display: list[str]) -> None:
         """Capture UI chrome lines visible on the display.
@@ -70,12 +67,11 @@ class ContentDeduplicator:
         Args:
             display: Full terminal display lines.
         """
-        snap: set[str] = set()
-        for line in display:
-            stripped = line.strip()
-            if stripped and classify_text_line(line) in CHROME_CATEGORIES:
-                snap.add(stripped)
-        self.thinking_snapshot = snap
+        self.thinking_snapshot = {
+            stripped for line in display
+            if (stripped := line.strip())
+            and classify_text_line(line) in CHROME_CATEGORIES
+        }
 
     def clear(self) -> None:
         """Clear dedup state for a fresh response cycle.
@@ -102,21 +98,18 @@ class ContentDeduplicator:
         Returns:
             Filtered and dedented content string, or empty string.
         """
-        snap = self.thinking_snapshot if use_snapshot else set()
+        snap = self.thinking_snapshot if use_snapshot else frozenset()
+        sent = self.sent_lines
         lines = content.split("\n")
-        new_lines = []
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                new_lines.append(line)
-            elif stripped not in self.sent_lines and stripped not in snap:
-                new_lines.append(line)
+        stripped_lines = [line.strip() for line in lines]
+        new_lines = [
+            line for line, stripped in zip(lines, stripped_lines)
+            if not stripped or (stripped not in sent and stripped not in snap)
+        ]
         # Record all content lines as sent AFTER the full batch so that
         # repeated lines within the same response (e.g. multiple
         # ``return False``) are preserved.
-        self.sent_lines.update(
-            stripped for line in lines if (stripped := line.strip())
-        )
+        sent.update(filter(None, stripped_lines))
         if not new_lines:
             return ""
         return textwrap.dedent("\n".join(new_lines)).strip()
@@ -1,8 +1,35 @@
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import logging
 
 import pytest
 
+from src.core.config import (
+    AppConfig,
+    ClaudeConfig,
+    DatabaseConfig,
+    ProjectsConfig,
+    SessionsConfig,
+    TelegramConfig,
+)
+
+
+def make_config(authorized_users=(111,), env=None):
+    """Build a real AppConfig for tests.
+
+    Plain dataclasses are far cheaper than nested MagicMocks and fail loudly
+    if code under test reads a config field that does not exist. *env*
+    becomes ``claude.env``.
+    """
+    return AppConfig(
+        telegram=TelegramConfig(
+            bot_token="test-token", authorized_users=frozenset(authorized_users),
+        ),
+        projects=ProjectsConfig(root="/tmp/projects"),
+        sessions=SessionsConfig(),
+        claude=ClaudeConfig(env=dict(env or {})),
+        database=DatabaseConfig(),
+    )
+
 
 @pytest.fixture
 def tmp_projects(tmp_path):
@@ -22,20 +49,15 @@ def tmp_projects(tmp_path):
 
 
 @pytest.fixture
-def mock_update():
-    """Create a mock Telegram Update with common attributes."""
-    update = MagicMock()
-    update.effective_user.id = 111
-    update.message.reply_text = AsyncMock()
-    update.message.reply_document = AsyncMock()
-    return update
-
-
-@pytest.fixture
-def mock_context():
-    """Create a mock context with config authorizing user 111."""
-    context = MagicMock()
-    config = MagicMock()
-    config.telegram.authorized_users = [111]
-    context.bot_data = {"config": config}
-    return context
+def restore_logging():
+    """Undo setup_logging() side effects on the "src"/"claude-bot" loggers.
+
+    setup_logging() replaces handlers and levels on process-global loggers;
+    restoring them keeps tests order-independent under xdist.
+    """
+    loggers = [logging.getLogger(name) for name in ("claude-bot", "src")]
+    saved = [(lg, lg.level, lg.handlers[:]) for lg in loggers]
+    yield
+    for lg, level, handlers in saved:
+        lg.setLevel(level)
+        lg.handlers[:] = handlers
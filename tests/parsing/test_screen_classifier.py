@@ -1,3 +1,5 @@
+import pytest
+
 from src.parsing.screen_classifier import classify_screen_state
 from src.parsing.ui_patterns import ScreenEvent, ScreenState
 from tests.parsing.conftest import (
@@ -268,6 +270,7 @@ class TestClassifyScreenState:
         assert classify_text_line("─" * 38 + "\uFFFD\uFFFD") == "separator"
 
 
+@pytest.mark.usefixtures("restore_logging")
 class TestClassifyScreenStateLogging:
     def test_classify_logs_result_at_trace(self, caplog):
         from src.core.log_setup import TRACE, setup_logging
@@ -1,21 +1,18 @@
+import dataclasses
+
+import pytest
+
 from src.parsing.ui_patterns import ScreenEvent, ScreenState, classify_text_line, extract_content
 
 
 class TestScreenState:
     def test_all_states_exist(self):
-        assert ScreenState.STARTUP.value == "startup"
-        assert ScreenState.IDLE.value == "idle"
-        assert ScreenState.THINKING.value == "thinking"
-        assert ScreenState.STREAMING.value == "streaming"
-        assert ScreenState.USER_MESSAGE.value == "user_message"
-        assert ScreenState.TOOL_REQUEST.value == "tool_request"
-        assert ScreenState.TOOL_RUNNING.value == "tool_running"
-        assert ScreenState.TOOL_RESULT.value == "tool_result"
-        assert ScreenState.BACKGROUND_TASK.value == "background_task"
-        assert ScreenState.PARALLEL_AGENTS.value == "parallel_agents"
-        assert ScreenState.TODO_LIST.value == "todo_list"
-        assert ScreenState.ERROR.value == "error"
-        assert ScreenState.UNKNOWN.value == "unknown"
+        assert [s.value for s in ScreenState] == [
+            "startup", "idle", "thinking", "streaming", "user_message",
+            "tool_request", "tool_running", "tool_result", "background_task",
+            "parallel_agents", "todo_list", "auth_required", "error",
+            "unknown",
+        ]
 
     def test_enum_count(self):
         assert len(ScreenState) == 14
@@ -38,6 +35,12 @@ class TestScreenEvent:
         assert event.payload["text"] == "Deploying robot army…"
         assert len(event.raw_lines) == 1
 
+    def test_slotted_and_frozen(self):
+        event = ScreenEvent(state=ScreenState.IDLE)
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.state = ScreenState.THINKING
+
 
 class TestClassifyLine:
     def test_empty(self):
@@ -48,6 +51,15 @@ class TestClassifyLine:
         assert classify_text_line("────────────────────") == "separator"
         assert classify_text_line("━━━━━━━━━━━━━━━━━━━━") == "separator"
 
+    def test_separator_trailing_replacement_chars(self):
+        """pyte renders partial ANSI sequences as trailing U+FFFD."""
+        assert classify_text_line("────────\uFFFD\uFFFD") == "separator"
+        assert classify_text_line("╌╌╌╌╌╌\uFFFD") == "diff_delimiter"
+
+    def test_short_rule_is_not_separator(self):
+        assert classify_text_line("───") != "separator"
+        assert classify_text_line("╌╌╌") != "diff_delimiter"
+
     def test_diff_delimiter(self):
         assert classify_text_line("╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌") == "diff_delimiter"
 
@@ -175,6 +187,21 @@ class TestClassifyLine:
         assert classify_text_line("4") == "content"
         assert classify_text_line("The answer is 42.") == "content"
 
+    def test_ascii_lines_use_text_checks_only(self):
+        """Plain ASCII lines can still be startup, status bar or tool header."""
+        assert classify_text_line("Claude Code v2.1.39") == "startup"
+        assert classify_text_line("Tip: use /help") == "status_bar"
+        assert classify_text_line("  Bash(ls -la)") == "tool_header"
+        assert classify_text_line("---- not a separator ----") == "content"
+
+    def test_repeated_line_served_from_cache(self):
+        """Chrome lines repeat every poll cycle; repeats must hit the memo."""
+        line = "  my-project │ ⎇ cache-test │ Usage: 12%"
+        first = classify_text_line(line)
+        hits = classify_text_line.cache_info().hits
+        assert classify_text_line(line) == first == "status_bar"
+        assert classify_text_line.cache_info().hits == hits + 1
+
 
 class TestExtractContent:
     def test_filters_ui_chrome(self):
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, Mock, mock_open, patch
 
 import pytest
 
@@ -17,66 +17,32 @@ from src.telegram.handlers import (
     handle_callback_query,
     handle_exit,
     handle_sessions,
-    handle_start,
     handle_text_message,
 )
-
-
-class TestHandleHistoryAuth:
-    @pytest.mark.asyncio
-    async def test_unauthorized(self):
-        update = MagicMock()
-        update.effective_user.id = 999
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        context.bot_data = {
-            "config": MagicMock(telegram=MagicMock(authorized_users=[111]))
-        }
-        await handle_history(update, context)
-        call_text = update.message.reply_text.call_args[0][0]
-        assert "not authorized" in call_text.lower()
-
-
-class TestHandleGitAuth:
-    @pytest.mark.asyncio
-    async def test_unauthorized(self):
-        update = MagicMock()
-        update.effective_user.id = 999
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        context.bot_data = {
-            "config": MagicMock(telegram=MagicMock(authorized_users=[111]))
-        }
-        await handle_git(update, context)
-        call_text = update.message.reply_text.call_args[0][0]
-        assert "not authorized" in call_text.lower()
-
-
-class TestHandleUpdateAuth:
-    @pytest.mark.asyncio
-    async def test_unauthorized(self):
-        update = MagicMock()
-        update.effective_user.id = 999
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        context.bot_data = {
-            "config": MagicMock(telegram=MagicMock(authorized_users=[111]))
+from tests.telegram.conftest import awaitable_mock
+
+
+@pytest.fixture(scope="module")
+def fifteen_sessions():
+    """Read-only history rows: ids 1-15, the first two still active."""
+    return tuple(
+        {
+            "id": i,
+            "project": f"proj-{i}",
+            "started_at": f"2026-02-09T10:0{i % 10}:00",
+            "ended_at": None,
+            "status": "active" if i <= 2 else "ended",
+            "exit_code": None if i <= 2 else 0,
         }
-        await handle_update_claude(update, context)
-        call_text = update.message.reply_text.call_args[0][0]
-        assert "not authorized" in call_text.lower()
+        for i in range(1, 16)
+    )
 
 
 class TestHandleHistory:
-    @pytest.mark.asyncio
-    async def test_shows_history(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        db = AsyncMock()
-        db.list_sessions = AsyncMock(
+    async def test_shows_history(self, make_update, make_context):
+        update = make_update()
+        db = Mock()
+        db.list_sessions = awaitable_mock(
             return_value=[
                 {
                     "project": "p1",
@@ -87,20 +53,15 @@ class TestHandleHistory:
                 }
             ]
         )
-        context.bot_data = {"config": config, "db": db}
+        context = make_context(db=db)
         await handle_history(update, context)
         update.message.reply_text.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_history_uses_html_parse_mode(self):
+    async def test_history_uses_html_parse_mode(self, make_update, make_context):
         """Regression: /history must use parse_mode=HTML, not raw text."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        db = AsyncMock()
-        db.list_sessions = AsyncMock(
+        update = make_update()
+        db = Mock()
+        db.list_sessions = awaitable_mock(
             return_value=[
                 {
                     "id": 7,
@@ -112,7 +73,7 @@ class TestHandleHistory:
                 }
             ]
         )
-        context.bot_data = {"config": config, "db": db}
+        context = make_context(db=db)
         await handle_history(update, context)
         call_kwargs = update.message.reply_text.call_args
         assert call_kwargs.kwargs.get("parse_mode") == "HTML"
@@ -122,29 +83,15 @@ class TestHandleHistory:
         assert "*my-proj*" not in body
         assert ".958687" not in body
 
-    @pytest.mark.asyncio
-    async def test_history_readability(self):
+    async def test_history_readability(
+        self, make_update, make_context, fifteen_sessions,
+    ):
         """Regression for issue 001: /history must have header, entry limit, and visual structure."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        db = AsyncMock()
+        update = make_update()
+        db = Mock()
         # 15 sessions — only first 10 should be shown
-        sessions = [
-            {
-                "id": i,
-                "project": f"proj-{i}",
-                "started_at": f"2026-02-09T10:0{i % 10}:00",
-                "ended_at": None,
-                "status": "active" if i <= 2 else "ended",
-                "exit_code": None if i <= 2 else 0,
-            }
-            for i in range(1, 16)
-        ]
-        db.list_sessions = AsyncMock(return_value=sessions)
-        context.bot_data = {"config": config, "db": db}
+        db.list_sessions = awaitable_mock(return_value=list(fifteen_sessions))
+        context = make_context(db=db)
         await handle_history(update, context)
         body = update.message.reply_text.call_args.args[0]
         # Header with count
@@ -155,107 +102,88 @@ class TestHandleHistory:
         # Double newline separation between entries
         assert "\n\n" in body
 
-    @pytest.mark.asyncio
-    async def test_empty_history(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        db = AsyncMock()
-        db.list_sessions = AsyncMock(return_value=[])
-        context.bot_data = {"config": config, "db": db}
+    async def test_empty_history(self, make_update, make_context):
+        update = make_update()
+        db = Mock()
+        db.list_sessions = awaitable_mock(return_value=[])
+        context = make_context(db=db)
         await handle_history(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "no" in call_text.lower()
 
 
 class TestHandleGit:
-    @pytest.mark.asyncio
-    async def test_shows_git_info(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
+    async def test_shows_git_info(
+        self, make_update, make_context, make_session_manager, monkeypatch,
+    ):
+        update = make_update()
         session = MagicMock(project_path="/a/proj")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {"config": config, "session_manager": sm}
-        with patch("src.telegram.commands.get_git_info", new_callable=AsyncMock) as mock_git:
-            mock_git.return_value = MagicMock(
+        sm = make_session_manager(active=session)
+        context = make_context(session_manager=sm)
+        monkeypatch.setattr(
+            "src.telegram.commands.get_git_info",
+            awaitable_mock(return_value=MagicMock(
                 format=MagicMock(return_value="Branch: main | No open PR")
-            )
-            await handle_git(update, context)
-            update.message.reply_text.assert_called_once()
-            assert "main" in update.message.reply_text.call_args[0][0]
+            )),
+        )
+        await handle_git(update, context)
+        update.message.reply_text.assert_called_once()
+        assert "main" in update.message.reply_text.call_args[0][0]
 
-    @pytest.mark.asyncio
-    async def test_git_uses_html_parse_mode(self):
+    async def test_git_uses_html_parse_mode(
+        self, make_update, make_context, make_session_manager, monkeypatch,
+    ):
         """Regression: /git must use parse_mode=HTML since format() produces HTML."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
+        update = make_update()
         session = MagicMock(project_path="/a/proj")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {"config": config, "session_manager": sm}
-        with patch("src.telegram.commands.get_git_info", new_callable=AsyncMock) as mock_git:
-            mock_git.return_value = MagicMock(
+        sm = make_session_manager(active=session)
+        context = make_context(session_manager=sm)
+        monkeypatch.setattr(
+            "src.telegram.commands.get_git_info",
+            awaitable_mock(return_value=MagicMock(
                 format=MagicMock(
                     return_value='Branch: <code>main</code> | No open PR'
                 )
-            )
-            await handle_git(update, context)
-            call_kwargs = update.message.reply_text.call_args
-            assert call_kwargs.kwargs.get("parse_mode") == "HTML"
-
-    @pytest.mark.asyncio
-    async def test_no_active_session(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+            )),
+        )
+        await handle_git(update, context)
+        call_kwargs = update.message.reply_text.call_args
+        assert call_kwargs.kwargs.get("parse_mode") == "HTML"
+
+    async def test_no_active_session(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_git(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "no active" in call_text.lower()
 
 
 class TestHandleUpdateClaude:
-    @pytest.mark.asyncio
-    async def test_no_active_sessions_updates_directly(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(
-            telegram=MagicMock(authorized_users=[111]),
-            claude=MagicMock(update_command="echo updated"),
-        )
-        sm = MagicMock(has_active_sessions=MagicMock(return_value=False))
-        context.bot_data = {"config": config, "session_manager": sm}
-        with patch(
-            "src.telegram.commands._run_update_command", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = "Updated to v2.0"
-            await handle_update_claude(update, context)
-            mock_run.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_with_active_sessions_warns(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(
-            has_active_sessions=MagicMock(return_value=True),
-            active_session_count=MagicMock(return_value=2),
+    async def test_no_active_sessions_updates_directly(
+        self, make_update, make_context, make_session_manager, monkeypatch,
+    ):
+        update = make_update()
+        # The "Updating..." status message is edited in place with the result
+        update.message.reply_text.return_value.edit_text = awaitable_mock()
+        sm = make_session_manager(has_active_sessions=False)
+        context = make_context(session_manager=sm)
+        context.bot_data["config"].claude.update_command = "echo updated"
+        mock_run = awaitable_mock(return_value="Updated to v2.0")
+        monkeypatch.setattr("src.telegram.commands._run_update_command", mock_run)
+        await handle_update_claude(update, context)
+        mock_run.assert_called_once()
+
+    async def test_with_active_sessions_warns(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
+        sm = make_session_manager(
+            has_active_sessions=True, active_session_count=2,
         )
-        context.bot_data = {"config": config, "session_manager": sm}
+        context = make_context(session_manager=sm)
         await handle_update_claude(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "2" in call_text
@@ -264,285 +192,215 @@ class TestHandleUpdateClaude:
 class TestUpdateClaudeImmediateFeedback:
     """Regression test for issue 009: /update_claude immediate feedback."""
 
-    @pytest.mark.asyncio
-    async def test_sends_updating_message_before_running_command(self):
+    async def test_sends_updating_message_before_running_command(
+        self, make_update, make_context, make_session_manager, monkeypatch,
+    ):
         """The handler must send a status message before awaiting the update."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        status_msg = AsyncMock()
-        update.message.reply_text = AsyncMock(return_value=status_msg)
-        context = MagicMock()
-        config = MagicMock(
-            telegram=MagicMock(authorized_users=[111]),
-            claude=MagicMock(update_command="echo updated"),
+        update = make_update()
+        status_msg = Mock(edit_text=awaitable_mock())
+        update.message.reply_text = awaitable_mock(return_value=status_msg)
+        sm = make_session_manager(has_active_sessions=False)
+        context = make_context(session_manager=sm)
+        context.bot_data["config"].claude.update_command = "echo updated"
+        monkeypatch.setattr(
+            "src.telegram.commands._run_update_command",
+            awaitable_mock(return_value="OK: updated"),
         )
-        sm = MagicMock(has_active_sessions=MagicMock(return_value=False))
-        context.bot_data = {"config": config, "session_manager": sm}
-        with patch(
-            "src.telegram.commands._run_update_command", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = "OK: updated"
-            await handle_update_claude(update, context)
-            # First call to reply_text is the immediate "Updating..." feedback
-            first_reply = update.message.reply_text.call_args_list[0][0][0]
-            assert "Updating" in first_reply
-            # Then the status message is edited with the result
-            status_msg.edit_text.assert_called_once()
-            edited_text = status_msg.edit_text.call_args[0][0]
-            assert "OK: updated" in edited_text
+        await handle_update_claude(update, context)
+        # First call to reply_text is the immediate "Updating..." feedback
+        first_reply = update.message.reply_text.call_args_list[0][0][0]
+        assert "Updating" in first_reply
+        # Then the status message is edited with the result
+        status_msg.edit_text.assert_called_once()
+        edited_text = status_msg.edit_text.call_args[0][0]
+        assert "OK: updated" in edited_text
 
 
 class TestUpdateClaudeResultFormatting:
     """Regression test for issue 010: /update_claude result paths as command links."""
 
-    @pytest.mark.asyncio
-    async def test_update_result_wrapped_in_code_tags(self):
+    async def test_update_result_wrapped_in_code_tags(
+        self, make_update, make_context, make_session_manager, monkeypatch,
+    ):
         """Update result containing file paths must be wrapped in <code> tags."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        status_msg = AsyncMock()
-        update.message.reply_text = AsyncMock(return_value=status_msg)
-        context = MagicMock()
-        config = MagicMock(
-            telegram=MagicMock(authorized_users=[111]),
-            claude=MagicMock(update_command="brew upgrade claude-code"),
+        update = make_update()
+        status_msg = Mock(edit_text=awaitable_mock())
+        update.message.reply_text = awaitable_mock(return_value=status_msg)
+        sm = make_session_manager(has_active_sessions=False)
+        context = make_context(session_manager=sm)
+        context.bot_data["config"].claude.update_command = "brew upgrade claude-code"
+        monkeypatch.setattr(
+            "src.telegram.commands._run_update_command",
+            awaitable_mock(
+                return_value="FAILED (exit 1): Error: /opt/homebrew/Cellar is not writable",
+            ),
         )
-        sm = MagicMock(has_active_sessions=MagicMock(return_value=False))
-        context.bot_data = {"config": config, "session_manager": sm}
-        with patch(
-            "src.telegram.commands._run_update_command", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = (
-                "FAILED (exit 1): Error: /opt/homebrew/Cellar is not writable"
-            )
-            await handle_update_claude(update, context)
-            call_kwargs = status_msg.edit_text.call_args
-            edited_text = call_kwargs[0][0]
-            assert "<code>" in edited_text
-            assert "parse_mode" in call_kwargs[1]
-            assert call_kwargs[1]["parse_mode"] == "HTML"
-
-    @pytest.mark.asyncio
-    async def test_update_result_html_escaped(self):
+        await handle_update_claude(update, context)
+        call_kwargs = status_msg.edit_text.call_args
+        edited_text = call_kwargs[0][0]
+        assert "<code>" in edited_text
+        assert "parse_mode" in call_kwargs[1]
+        assert call_kwargs[1]["parse_mode"] == "HTML"
+
+    async def test_update_result_html_escaped(
+        self, make_update, make_context, make_session_manager, monkeypatch,
+    ):
         """HTML special chars in update output must be escaped."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        status_msg = AsyncMock()
-        update.message.reply_text = AsyncMock(return_value=status_msg)
-        context = MagicMock()
-        config = MagicMock(
-            telegram=MagicMock(authorized_users=[111]),
-            claude=MagicMock(update_command="echo test"),
+        update = make_update()
+        status_msg = Mock(edit_text=awaitable_mock())
+        update.message.reply_text = awaitable_mock(return_value=status_msg)
+        sm = make_session_manager(has_active_sessions=False)
+        context = make_context(session_manager=sm)
+        context.bot_data["config"].claude.update_command = "echo test"
+        monkeypatch.setattr(
+            "src.telegram.commands._run_update_command",
+            awaitable_mock(return_value="OK: version <2.0> & stuff"),
         )
-        sm = MagicMock(has_active_sessions=MagicMock(return_value=False))
-        context.bot_data = {"config": config, "session_manager": sm}
-        with patch(
-            "src.telegram.commands._run_update_command", new_callable=AsyncMock
-        ) as mock_run:
-            mock_run.return_value = "OK: version <2.0> & stuff"
-            await handle_update_claude(update, context)
-            edited_text = status_msg.edit_text.call_args[0][0]
-            assert "&lt;2.0&gt;" in edited_text
-            assert "&amp;" in edited_text
+        await handle_update_claude(update, context)
+        edited_text = status_msg.edit_text.call_args[0][0]
+        assert "&lt;2.0&gt;" in edited_text
+        assert "&amp;" in edited_text
 
 
 class TestHandleContext:
-    @pytest.mark.asyncio
-    async def test_sends_context_command(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
+    async def test_sends_context_command(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
         session = MagicMock()
-        session.process.submit = AsyncMock()
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {"config": config, "session_manager": sm}
+        session.process.submit = awaitable_mock()
+        sm = make_session_manager(active=session)
+        context = make_context(session_manager=sm)
         await handle_context(update, context)
         session.process.submit.assert_called_once_with("/context")
         update.message.reply_text.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_no_active_session(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+    async def test_no_active_session(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_context(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "no active" in call_text.lower()
 
 
 class TestHandleDownload:
-    @pytest.mark.asyncio
-    async def test_file_found(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download /tmp/test.txt"
-        update.message.reply_text = AsyncMock()
-        update.message.reply_document = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        fh = MagicMock(
-            file_exists=MagicMock(return_value=True),
-            _base_dir="/tmp",
-        )
+    async def test_file_found(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update(text="/download /tmp/test.txt")
+        fh = make_file_handler(exists=True, base_dir="/tmp")
         session = MagicMock(project_path="/some/project")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {
-            "config": config, "file_handler": fh, "session_manager": sm
-        }
-        with patch("builtins.open", MagicMock()):
+        sm = make_session_manager(active=session)
+        context = make_context(file_handler=fh, session_manager=sm)
+        with patch(
+            "src.telegram.commands.open", mock_open(read_data=b""), create=True,
+        ) as mocked_open:
             await handle_download(update, context)
-            update.message.reply_document.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_file_not_found(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download /tmp/nonexistent.txt"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        fh = MagicMock(
-            file_exists=MagicMock(return_value=False),
-            _base_dir="/tmp",
-        )
+        mocked_open.assert_called_once_with("/tmp/test.txt", "rb")
+        update.message.reply_document.assert_called_once()
+
+    async def test_file_not_found(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update(text="/download /tmp/nonexistent.txt")
+        fh = make_file_handler(exists=False, base_dir="/tmp")
         session = MagicMock(project_path="/some/project")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {
-            "config": config, "file_handler": fh, "session_manager": sm
-        }
+        sm = make_session_manager(active=session)
+        context = make_context(file_handler=fh, session_manager=sm)
         await handle_download(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "not found" in call_text.lower()
 
-    @pytest.mark.asyncio
-    async def test_missing_path_arg(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        fh = MagicMock()
+    async def test_missing_path_arg(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update(text="/download")
+        fh = make_file_handler()
         session = MagicMock(project_path="/some/project")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {"config": config, "file_handler": fh, "session_manager": sm}
+        sm = make_session_manager(active=session)
+        context = make_context(file_handler=fh, session_manager=sm)
         await handle_download(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "usage" in call_text.lower()
 
-    @pytest.mark.asyncio
-    async def test_path_traversal_denied(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download /etc/passwd"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        fh = MagicMock(
-            file_exists=MagicMock(return_value=True),
-            _base_dir="/tmp/claude",
-        )
+    async def test_path_traversal_denied(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update(text="/download /etc/passwd")
+        fh = make_file_handler(exists=True, base_dir="/tmp/claude")
         session = MagicMock(project_path="/home/user/project")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {
-            "config": config, "file_handler": fh, "session_manager": sm
-        }
+        sm = make_session_manager(active=session)
+        context = make_context(file_handler=fh, session_manager=sm)
         await handle_download(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "access denied" in call_text.lower()
 
 
 class TestHandleFileUpload:
-    @pytest.mark.asyncio
-    async def test_document_upload(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+    async def test_document_upload(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update()
         update.message.document = MagicMock(file_id="abc", file_name="test.py")
         update.message.photo = None
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
         session = MagicMock(project_name="proj", session_id=1)
-        session.process.write = AsyncMock()
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        fh = MagicMock(get_upload_path=MagicMock(return_value="/tmp/test.py"))
-        context.bot_data = {
-            "config": config, "session_manager": sm, "file_handler": fh
-        }
-        file_obj = AsyncMock()
-        context.bot.get_file = AsyncMock(return_value=file_obj)
+        session.process.write = awaitable_mock()
+        sm = make_session_manager(active=session)
+        fh = make_file_handler(upload_path="/tmp/test.py")
+        context = make_context(session_manager=sm, file_handler=fh)
+        file_obj = Mock(download_to_drive=awaitable_mock())
+        context.bot.get_file = awaitable_mock(return_value=file_obj)
         await handle_file_upload(update, context)
         file_obj.download_to_drive.assert_called_once_with("/tmp/test.py")
         session.process.write.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_photo_upload(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+    async def test_photo_upload(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update()
         update.message.document = None
         photo = MagicMock(file_id="photo123", file_name=None)
         update.message.photo = [MagicMock(), photo]  # [-1] is largest
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
         session = MagicMock(project_name="proj", session_id=1)
-        session.process.write = AsyncMock()
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        fh = MagicMock(get_upload_path=MagicMock(return_value="/tmp/photo.bin"))
-        context.bot_data = {
-            "config": config, "session_manager": sm, "file_handler": fh
-        }
-        file_obj = AsyncMock()
-        context.bot.get_file = AsyncMock(return_value=file_obj)
+        session.process.write = awaitable_mock()
+        sm = make_session_manager(active=session)
+        fh = make_file_handler(upload_path="/tmp/photo.bin")
+        context = make_context(session_manager=sm, file_handler=fh)
+        file_obj = Mock(download_to_drive=awaitable_mock())
+        context.bot.get_file = awaitable_mock(return_value=file_obj)
         await handle_file_upload(update, context)
         file_obj.download_to_drive.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_no_active_session(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+    async def test_no_active_session(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
         update.message.document = MagicMock(file_id="abc")
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_file_upload(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "no active" in call_text.lower()
 
-    @pytest.mark.asyncio
-    async def test_unauthorized_ignored(self):
-        update = MagicMock()
-        update.effective_user.id = 999
-        update.message.reply_text = AsyncMock()
+    async def test_unauthorized_ignored(self, make_update, make_context):
+        update = make_update(user_id=999)
         update.message.document = MagicMock(file_id="abc")
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        context.bot_data = {"config": config}
+        context = make_context()
         await handle_file_upload(update, context)
         update.message.reply_text.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_no_document(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+    async def test_no_document(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
+        update = make_update()
         update.message.document = None
         update.message.photo = None
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
         session = MagicMock()
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {
-            "config": config, "session_manager": sm, "file_handler": MagicMock()
-        }
+        sm = make_session_manager(active=session)
+        context = make_context(session_manager=sm, file_handler=make_file_handler())
         await handle_file_upload(update, context)
         update.message.reply_text.assert_not_called()
 
@@ -550,22 +408,17 @@ class TestHandleFileUpload:
 class TestCommandsBlockedDuringToolApproval:
     """Regression tests for issue 016: PTY-forwarding commands blocked during tool approval."""
 
-    @pytest.mark.asyncio
-    async def test_context_blocked_when_tool_request_pending(self):
+    async def test_context_blocked_when_tool_request_pending(
+        self, make_update, make_context, make_session_manager,
+    ):
         """'/context' must not forward to PTY when tool approval is pending."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+        update = make_update()
         session = MagicMock()
         session.session_id = 1
-        session.process.submit = AsyncMock()
-        context = MagicMock()
-        context.bot_data = {
-            "config": MagicMock(telegram=MagicMock(authorized_users=[111])),
-            "session_manager": MagicMock(
-                get_active_session=MagicMock(return_value=session)
-            ),
-        }
+        session.process.submit = awaitable_mock()
+        context = make_context(
+            session_manager=make_session_manager(active=session),
+        )
         with patch(
             "src.telegram.commands.is_tool_request_pending", return_value=True
         ):
@@ -574,46 +427,36 @@ class TestCommandsBlockedDuringToolApproval:
         reply = update.message.reply_text.call_args[0][0]
         assert "tool approval" in reply.lower()
 
-    @pytest.mark.asyncio
-    async def test_context_forwarded_when_no_tool_request(self):
+    async def test_context_forwarded_when_no_tool_request(
+        self, make_update, make_context, make_session_manager,
+    ):
         """'/context' forwards normally when no tool approval is pending."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+        update = make_update()
         session = MagicMock()
         session.session_id = 1
-        session.process.submit = AsyncMock()
-        context = MagicMock()
-        context.bot_data = {
-            "config": MagicMock(telegram=MagicMock(authorized_users=[111])),
-            "session_manager": MagicMock(
-                get_active_session=MagicMock(return_value=session)
-            ),
-        }
+        session.process.submit = awaitable_mock()
+        context = make_context(
+            session_manager=make_session_manager(active=session),
+        )
         with patch(
             "src.telegram.commands.is_tool_request_pending", return_value=False
         ):
             await handle_context(update, context)
         session.process.submit.assert_called_once_with("/context")
 
-    @pytest.mark.asyncio
-    async def test_file_upload_blocked_when_tool_request_pending(self):
+    async def test_file_upload_blocked_when_tool_request_pending(
+        self, make_update, make_context, make_session_manager,
+    ):
         """File upload must not forward to PTY when tool approval is pending."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+        update = make_update()
         update.message.document = MagicMock(file_id="abc", file_name="test.py")
         update.message.photo = None
         session = MagicMock()
         session.session_id = 1
-        session.process.write = AsyncMock()
-        context = MagicMock()
-        context.bot_data = {
-            "config": MagicMock(telegram=MagicMock(authorized_users=[111])),
-            "session_manager": MagicMock(
-                get_active_session=MagicMock(return_value=session)
-            ),
-        }
+        session.process.write = awaitable_mock()
+        context = make_context(
+            session_manager=make_session_manager(active=session),
+        )
         with patch(
             "src.telegram.commands.is_tool_request_pending", return_value=True
         ):
@@ -626,72 +469,53 @@ class TestCommandsBlockedDuringToolApproval:
 class TestNoSessionMessagesIncludeStartHint:
     """Regression for issue 005: all no-session messages must include /start hint."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize("handler,bot_data_extras", [
-        (handle_git, {"session_manager": MagicMock(get_active_session=MagicMock(return_value=None))}),
-        (handle_context, {"session_manager": MagicMock(get_active_session=MagicMock(return_value=None))}),
-    ])
-    async def test_command_no_session_includes_start_hint(self, handler, bot_data_extras):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        context.bot_data = {"config": config, **bot_data_extras}
+    @pytest.mark.parametrize("handler", [handle_git, handle_context])
+    async def test_command_no_session_includes_start_hint(
+        self, handler, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
+        context = make_context(session_manager=make_session_manager())
         await handler(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text, f"{handler.__name__} no-session message missing /start hint: {call_text!r}"
 
-    @pytest.mark.asyncio
-    async def test_file_upload_no_session_includes_start_hint(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
+    async def test_file_upload_no_session_includes_start_hint(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
         update.message.document = MagicMock(file_id="abc")
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_file_upload(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text, f"file_upload no-session message missing /start hint: {call_text!r}"
 
-    @pytest.mark.asyncio
-    async def test_sessions_no_session_includes_start_hint(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(list_sessions=MagicMock(return_value=[]))
-        context.bot_data = {"config": config, "session_manager": sm}
+    async def test_sessions_no_session_includes_start_hint(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
+        sm = make_session_manager(list_sessions=[])
+        context = make_context(session_manager=sm)
         await handle_sessions(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text, f"sessions no-session message missing /start hint: {call_text!r}"
 
-    @pytest.mark.asyncio
-    async def test_exit_no_session_includes_start_hint(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+    async def test_exit_no_session_includes_start_hint(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update()
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_exit(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text, f"exit no-session message missing /start hint: {call_text!r}"
 
-    @pytest.mark.asyncio
-    async def test_text_message_no_session_includes_start_hint(self):
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "hello"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+    async def test_text_message_no_session_includes_start_hint(
+        self, make_update, make_context, make_session_manager,
+    ):
+        update = make_update(text="hello")
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_text_message(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text, f"text_message no-session message missing /start hint: {call_text!r}"
@@ -700,33 +524,25 @@ class TestNoSessionMessagesIncludeStartHint:
 class TestDownloadSessionCheckBeforeUsage:
     """Regression for issue 008: /download must check for active session before showing usage."""
 
-    @pytest.mark.asyncio
-    async def test_no_session_returns_start_hint_not_usage(self):
+    async def test_no_session_returns_start_hint_not_usage(
+        self, make_update, make_context, make_session_manager,
+    ):
         """Without an active session, /download (no args) should say 'no active session', not show usage."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+        update = make_update(text="/download")
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_download(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text
         assert "usage" not in call_text.lower()
 
-    @pytest.mark.asyncio
-    async def test_no_session_with_path_returns_start_hint(self):
+    async def test_no_session_with_path_returns_start_hint(
+        self, make_update, make_context, make_session_manager,
+    ):
         """Without an active session, /download /some/file should also say 'no active session'."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download /tmp/test.txt"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        sm = MagicMock(get_active_session=MagicMock(return_value=None))
-        context.bot_data = {"config": config, "session_manager": sm}
+        update = make_update(text="/download /tmp/test.txt")
+        sm = make_session_manager(active=None)
+        context = make_context(session_manager=sm)
         await handle_download(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         assert "/start" in call_text
@@ -736,19 +552,15 @@ class TestDownloadSessionCheckBeforeUsage:
 class TestDownloadUsageFormatting:
     """Regression for issue 007: /download usage path must not be parsed as Telegram commands."""
 
-    @pytest.mark.asyncio
-    async def test_usage_text_uses_html_code_tags(self):
+    async def test_usage_text_uses_html_code_tags(
+        self, make_update, make_context, make_session_manager, make_file_handler,
+    ):
         """The example path in usage must be wrapped in <code> to prevent command parsing."""
-        update = MagicMock()
-        update.effective_user.id = 111
-        update.message.text = "/download"
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
-        config = MagicMock(telegram=MagicMock(authorized_users=[111]))
-        fh = MagicMock()
+        update = make_update(text="/download")
+        fh = make_file_handler()
         session = MagicMock(project_path="/some/project")
-        sm = MagicMock(get_active_session=MagicMock(return_value=session))
-        context.bot_data = {"config": config, "file_handler": fh, "session_manager": sm}
+        sm = make_session_manager(active=session)
+        context = make_context(file_handler=fh, session_manager=sm)
         await handle_download(update, context)
         call_text = update.message.reply_text.call_args[0][0]
         call_kwargs = update.message.reply_text.call_args[1]
@@ -760,7 +572,6 @@ class TestDownloadUsageFormatting:
 
 
 class TestRunUpdateCommand:
-    @pytest.mark.asyncio
     async def test_runs_command(self):
         result = await _run_update_command("echo hello")
         assert "OK" in result
@@ -771,24 +582,17 @@ class TestRunUpdateCommand:
 
 
 @pytest.mark.parametrize("handler", [
-    handle_start, handle_sessions, handle_exit,
     handle_history, handle_git, handle_update_claude,
     handle_context, handle_download,
 ])
-@pytest.mark.asyncio
-async def test_unauthorized_rejected(handler):
-    update = MagicMock()
-    update.effective_user.id = 999
-    update.message.text = "/download /tmp/foo"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.bot_data = {
-        "config": MagicMock(telegram=MagicMock(authorized_users=[111])),
-        "file_handler": MagicMock(_base_dir="/tmp/claude"),
-        "session_manager": MagicMock(
-            get_active_session=MagicMock(return_value=None)
-        ),
-    }
+async def test_unauthorized_rejected(
+    handler, make_update, make_context, make_session_manager, make_file_handler,
+):
+    update = make_update(user_id=999, text="/download /tmp/foo")
+    context = make_context(
+        file_handler=make_file_handler(base_dir="/tmp/claude"),
+        session_manager=make_session_manager(active=None),
+    )
     await handler(update, context)
     call_text = update.message.reply_text.call_args[0][0]
     assert "not authorized" in call_text.lower()
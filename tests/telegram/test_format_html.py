@@ -1,253 +1,155 @@
 """Tests for format_html() — Telegram HTML output formatting."""
 
-from __future__ import annotations
+import re
 
-from src.telegram.formatter import format_html, wrap_code_blocks
-
-
-class TestFormatHtmlEscaping:
-    """HTML special characters must be escaped outside tags."""
-
-    def test_escapes_angle_brackets(self):
-        assert format_html("a < b > c") == "a &lt; b &gt; c"
-
-    def test_escapes_ampersand(self):
-        assert format_html("A & B") == "A &amp; B"
-
-    def test_empty_string(self):
-        assert format_html("") == ""
-
-
-class TestFormatHtmlBold:
-    """**bold** must become <b>bold</b>."""
-
-    def test_bold_conversion(self):
-        result = format_html("This is **bold** text")
-        assert "<b>bold</b>" in result
-
-    def test_multiple_bold(self):
-        result = format_html("**one** and **two**")
-        assert "<b>one</b>" in result
-        assert "<b>two</b>" in result
-
-
-class TestFormatHtmlItalic:
-    """*italic* must become <i>italic</i>."""
-
-    def test_italic_conversion(self):
-        result = format_html("This is *italic* text")
-        assert "<i>italic</i>" in result
-
-    def test_bold_not_treated_as_italic(self):
-        result = format_html("This is **bold** text")
-        assert "<i>" not in result
-
-
-class TestFormatHtmlInlineCode:
-    """`code` must become <code>code</code>."""
-
-    def test_inline_code(self):
-        result = format_html("Use the `print()` function")
-        assert "<code>print()</code>" in result
-
-    def test_code_content_escaped(self):
-        result = format_html("Use `a < b`")
-        assert "<code>a &lt; b</code>" in result
-
-
-class TestFormatHtmlCodeBlocks:
-    """```lang ... ``` must become <pre><code>...</code></pre>."""
-
-    def test_code_block_with_language(self):
-        text = "Before\n```python\nprint('hi')\n```\nAfter"
-        result = format_html(text)
-        assert '<pre><code class="language-python">' in result
-        assert "print(&#x27;hi&#x27;)" in result or "print('hi')" in result
-        assert "</code></pre>" in result
-
-    def test_code_block_without_language(self):
-        text = "```\nsome code\n```"
-        result = format_html(text)
-        assert "<pre><code>" in result
-        assert "some code" in result
-
-    def test_code_block_content_escaped(self):
-        text = "```\na < b && c > d\n```"
-        result = format_html(text)
-        assert "a &lt; b &amp;&amp; c &gt; d" in result
-
-
-class TestFormatHtmlBlockquotes:
-    """Tool output lines stay as plain text after format_html."""
-
-    def test_short_blockquote(self):
-        text = "Result:\nfile.txt line 1\nfile.txt line 2"
-        result = format_html(text)
-        assert "file.txt line 1" in result
-
-
-class TestFormatHtmlLists:
-    """List items with label — description must bold the label."""
+import pytest
 
-    def test_dash_label_description(self):
-        result = format_html("- label — description")
-        assert "• <b>label</b> — description" in result
-
-    def test_plain_list_item(self):
-        result = format_html("- plain item")
-        assert "• plain item" in result
-
-    def test_list_with_bold_no_double_tags(self):
-        """Bold in list label must not create nested <b> tags."""
-        result = format_html("- **label** — desc")
-        assert "<b><b>" not in result
-        assert "• <b>label</b> — desc" in result
-
-    def test_ordered_list_unchanged(self):
-        result = format_html("1. first item")
-        assert "1. first item" in result
+from src.telegram.formatter import format_html, wrap_code_blocks
 
-    def test_emdash_in_sentence_not_label(self):
-        """Regression: bullet with em-dash mid-sentence must not bold before dash."""
-        text = (
+# A whole result wrapped in one bare ``` fence; group 1 is the body.
+FENCED = re.compile(r"\A```\n(.*)\n```\Z", re.DOTALL)
+
+FULL_RESPONSE = (
+    "Here's the plan:\n"
+    "\n"
+    "- **Step 1** — do something\n"
+    "- Step 2 — do more\n"
+    "\n"
+    "```python\nx = 1\n```\n"
+    "\n"
+    "That's it."
+)
+
+
+class TestFormatHtml:
+    """Markdown subset → Telegram HTML, one assertion per parametrized row."""
+
+    @pytest.mark.parametrize("text, expected", [
+        # HTML special characters must be escaped outside tags
+        pytest.param("a < b > c", "a &lt; b &gt; c", id="escapes_angle_brackets"),
+        pytest.param("A & B", "A &amp; B", id="escapes_ampersand"),
+        pytest.param("", "", id="empty_string"),
+        # **bold** must become <b>bold</b>
+        pytest.param("This is **bold** text", "This is <b>bold</b> text", id="bold_conversion"),
+        pytest.param("**one** and **two**", "<b>one</b> and <b>two</b>", id="multiple_bold"),
+        # *italic* must become <i>italic</i>
+        pytest.param("This is *italic* text", "This is <i>italic</i> text", id="italic_conversion"),
+        # `code` must become <code>code</code>
+        pytest.param(
+            "Use the `print()` function", "Use the <code>print()</code> function",
+            id="inline_code",
+        ),
+        pytest.param("Use `a < b`", "Use <code>a &lt; b</code>", id="code_content_escaped"),
+        # ``` ... ``` must become <pre><code>...</code></pre>
+        pytest.param(
+            "Before\n```python\nprint('hi')\n```\nAfter",
+            "Before\n<pre><code class=\"language-python\">print('hi')\n</code></pre>\nAfter",
+            id="code_block_with_language",
+        ),
+        pytest.param(
+            "```\nsome code\n```", "<pre><code>some code\n</code></pre>",
+            id="code_block_without_language",
+        ),
+        pytest.param(
+            "```\na < b && c > d\n```",
+            "<pre><code>a &lt; b &amp;&amp; c &gt; d\n</code></pre>",
+            id="code_block_content_escaped",
+        ),
+        # Tool output lines stay as plain text
+        pytest.param(
+            "Result:\nfile.txt line 1\nfile.txt line 2",
+            "<b>Result:</b>\nfile.txt line 1\nfile.txt line 2",
+            id="short_blockquote",
+        ),
+        # List items with label — description must bold the label
+        pytest.param("- label — description", "• <b>label</b> — description", id="dash_label_description"),
+        pytest.param("- plain item", "• plain item", id="plain_list_item"),
+        pytest.param("- **label** — desc", "• <b>label</b> — desc", id="list_with_bold_label"),
+        pytest.param("1. first item", "1. first item", id="ordered_list_unchanged"),
+        # Regression: em-dash mid-sentence must not bold the text before it
+        pytest.param(
             "- Square root bound: only checks up to √n "
-            "— if n has a factor larger than its square root"
-        )
-        result = format_html(text)
-        # Should become plain bullet, NOT bold the text before —
-        assert "<b>Square root bound" not in result
-        assert "• Square root bound" in result
-
-    def test_label_with_colon_not_matched(self):
-        """Labels containing colons are likely sentences, not label-value."""
-        result = format_html("- Time complexity: O(n) — slow for large inputs")
-        assert "<b>Time complexity" not in result
-        assert "• Time complexity" in result
-
-
-class TestFormatHtmlSectionHeaders:
-    """Lines ending with : that look like headers get bolded."""
-
-    def test_section_header(self):
-        result = format_html("Key components:")
-        assert "<b>Key components:</b>" in result
-
-    def test_url_not_treated_as_header(self):
-        """URLs containing colons must NOT be treated as section headers."""
-        result = format_html("Visit https://example.com for more")
-        assert "<b>" not in result
-
-
-class TestFormatHtmlCombined:
-    """Multiple formatting rules in one text."""
-
-    def test_bold_and_code(self):
-        result = format_html("**Important**: use `foo()`")
-        assert "<b>Important</b>" in result
-        assert "<code>foo()</code>" in result
-
-    def test_full_response(self):
-        text = (
-            "Here's the plan:\n"
+            "— if n has a factor larger than its square root",
+            "• Square root bound: only checks up to √n "
+            "— if n has a factor larger than its square root",
+            id="emdash_in_sentence_not_label",
+        ),
+        # Labels containing colons are likely sentences, not label-value
+        pytest.param(
+            "- Time complexity: O(n) — slow for large inputs",
+            "• Time complexity: O(n) — slow for large inputs",
+            id="label_with_colon_not_matched",
+        ),
+        # Lines ending with : that look like headers get bolded
+        pytest.param("Key components:", "<b>Key components:</b>", id="section_header"),
+        # URLs containing colons must NOT be treated as section headers
+        pytest.param(
+            "Visit https://example.com for more", "Visit https://example.com for more",
+            id="url_not_treated_as_header",
+        ),
+        # Multiple formatting rules in one text
+        pytest.param(
+            "**Important**: use `foo()`", "<b>Important</b>: use <code>foo()</code>",
+            id="bold_and_code",
+        ),
+        pytest.param(
+            FULL_RESPONSE,
+            "<b>Here's the plan:</b>\n"
             "\n"
-            "- **Step 1** — do something\n"
-            "- Step 2 — do more\n"
+            "• <b>Step 1</b> — do something\n"
+            "• <b>Step 2</b> — do more\n"
             "\n"
-            "```python\nx = 1\n```\n"
+            "<pre><code class=\"language-python\">x = 1\n</code></pre>\n"
             "\n"
-            "That's it."
-        )
-        result = format_html(text)
-        assert "<b>Step 1</b>" in result
-        assert "<pre><code" in result
-        assert "x = 1" in result
-
+            "That's it.",
+            id="full_response",
+        ),
+    ])
+    def test_exact_output(self, text, expected):
+        assert format_html(text) == expected
 
-class TestWrapCodeBlocks:
-    """Heuristic code block detection for terminal-stripped content."""
-
-    def test_python_def_wrapped(self):
-        """Python function definition should be wrapped in code fences."""
-        text = 'def fibonacci(n: int) -> int:\n    if n <= 1:\n        return n'
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
-        assert result.endswith("\n```")
-        assert "def fibonacci" in result
-
-    def test_python_class_wrapped(self):
-        """Python class definition should be wrapped."""
-        text = "class Foo:\n    pass"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
-
-    def test_python_import_wrapped(self):
-        """Python import should be wrapped."""
-        text = "import os\nimport sys"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
-
-    def test_python_from_import_wrapped(self):
-        """Python from-import should be wrapped."""
-        text = "from pathlib import Path\n\npath = Path('.')"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
-
-    def test_async_def_wrapped(self):
-        """Async function should be wrapped."""
-        text = "async def fetch():\n    await something()"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
 
-    def test_js_function_wrapped(self):
-        """JavaScript function should be wrapped."""
-        text = "function hello() {\n  return 'world';\n}"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
+@pytest.fixture(scope="module")
+def wrapped_def():
+    """A Python def already passed through wrap_code_blocks."""
+    return wrap_code_blocks("def hello():\n    print('world')")
 
-    def test_js_const_wrapped(self):
-        """JavaScript const should be wrapped."""
-        text = "const x = 42;"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
 
-    def test_plain_text_not_wrapped(self):
-        """Regular prose should NOT be wrapped."""
-        text = "Four."
-        result = wrap_code_blocks(text)
-        assert result == "Four."
-
-    def test_sentence_not_wrapped(self):
-        """A normal sentence should NOT be wrapped."""
-        text = "The capital of France is Paris."
-        result = wrap_code_blocks(text)
-        assert result == text
-
-    def test_list_not_wrapped(self):
-        """A numbered list should NOT be wrapped."""
-        text = "1. First item\n2. Second item\n3. Third item"
-        result = wrap_code_blocks(text)
-        assert result == text
-
-    def test_empty_returns_empty(self):
-        """Empty input should return empty."""
-        assert wrap_code_blocks("") == ""
-
-    def test_decorator_wrapped(self):
-        """Python decorator should be wrapped."""
-        text = "@app.route('/api')\ndef handler():\n    pass"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
-
-    def test_shebang_wrapped(self):
-        """Shebang line should be wrapped."""
-        text = "#!/usr/bin/env python3\nimport sys"
-        result = wrap_code_blocks(text)
-        assert result.startswith("```\n")
+class TestWrapCodeBlocks:
+    """Heuristic code block detection for terminal-stripped content."""
 
-    def test_end_to_end_with_format_html(self):
+    @pytest.mark.parametrize("text", [
+        pytest.param(
+            "def fibonacci(n: int) -> int:\n    if n <= 1:\n        return n",
+            id="python_def",
+        ),
+        pytest.param("class Foo:\n    pass", id="python_class"),
+        pytest.param("import os\nimport sys", id="python_import"),
+        pytest.param("from pathlib import Path\n\npath = Path('.')", id="python_from_import"),
+        pytest.param("async def fetch():\n    await something()", id="async_def"),
+        pytest.param("function hello() {\n  return 'world';\n}", id="js_function"),
+        pytest.param("const x = 42;", id="js_const"),
+        pytest.param("@app.route('/api')\ndef handler():\n    pass", id="decorator"),
+        pytest.param("#!/usr/bin/env python3\nimport sys", id="shebang"),
+    ])
+    def test_code_wrapped(self, text):
+        """Code-looking text should be wrapped whole in code fences."""
+        fenced = FENCED.match(wrap_code_blocks(text))
+        assert fenced
+        assert fenced.group(1) == text
+
+    @pytest.mark.parametrize("text", [
+        pytest.param("Four.", id="plain_text"),
+        pytest.param("The capital of France is Paris.", id="sentence"),
+        pytest.param("1. First item\n2. Second item\n3. Third item", id="list"),
+        pytest.param("", id="empty"),
+    ])
+    def test_prose_passed_through(self, text):
+        """Prose, lists and empty input should come back unchanged."""
+        assert wrap_code_blocks(text) == text
+
+    def test_end_to_end_with_format_html(self, wrapped_def):
         """Code detection + format_html should produce <pre><code>."""
-        text = "def hello():\n    print('world')"
-        wrapped = wrap_code_blocks(text)
-        html = format_html(wrapped)
+        html = format_html(wrapped_def)
         assert "<pre><code>" in html
         assert "def hello()" in html
@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from src.telegram.keyboards import (
     _format_timestamp,
+    _render_history_entry,
     build_project_keyboard,
     build_sessions_keyboard,
     build_tool_approval_keyboard,
@@ -70,14 +71,14 @@ class TestBuildProjectKeyboard:
 class TestBuildSessionsKeyboard:
     def test_creates_session_buttons(self):
         sessions = [
-            MagicMock(session_id=1, project_name="alpha"),
-            MagicMock(session_id=2, project_name="beta"),
+            SimpleNamespace(session_id=1, project_name="alpha"),
+            SimpleNamespace(session_id=2, project_name="beta"),
         ]
         keyboard = build_sessions_keyboard(sessions, active_id=1)
         assert len(keyboard) >= 2
 
     def test_marks_active_session(self):
-        sessions = [MagicMock(session_id=1, project_name="alpha")]
+        sessions = [SimpleNamespace(session_id=1, project_name="alpha")]
         keyboard = build_sessions_keyboard(sessions, active_id=1)
         first_row_text = keyboard[0][0]["text"]
         assert "alpha" in first_row_text
@@ -173,6 +174,21 @@ class TestFormatMessages:
         assert ".958687" not in msg
         assert "+00:00" not in msg
 
+    def test_history_entry_repeat_render_is_cached(self):
+        """Re-rendering an unchanged row must return the cached string."""
+        entry = {
+            "id": 7,
+            "project": "cached-proj",
+            "started_at": "2026-02-09T10:02:35",
+            "ended_at": "2026-02-09T11:03:45",
+            "status": "ended",
+            "exit_code": 0,
+        }
+        first = format_history_entry(entry)
+        hits = _render_history_entry.cache_info().hits
+        assert format_history_entry(dict(entry)) == first
+        assert _render_history_entry.cache_info().hits == hits + 1
+
     def test_history_entry_escapes_html(self):
         """Project names with special chars must be HTML-escaped."""
         entry = {
@@ -205,6 +221,12 @@ class TestFormatTimestamp:
     def test_already_short(self):
         assert _format_timestamp("2026-02-09T10:02") == "2026-02-09 10:02"
 
+    def test_negative_offset(self):
+        assert _format_timestamp("2026-02-09T10:02:35-05:00") == "2026-02-09 10:02"
+
+    def test_unrecognized_returned_unchanged(self):
+        assert _format_timestamp("unknown") == "unknown"
+
 
 class TestBuildToolApprovalKeyboard:
     """Tests for the tool approval inline keyboard builder."""
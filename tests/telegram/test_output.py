@@ -8,8 +8,7 @@ import pytest
 from src.parsing.terminal_emulator import CharSpan
 from src.parsing.screen_classifier import classify_screen_state
 from src.parsing.ui_patterns import (
-    CHROME_CATEGORIES,
-    ScreenEvent, ScreenState, classify_text_line, extract_content,
+    ScreenEvent, ScreenState, extract_content,
 )
 from src.telegram.output import poll_output
 from src.telegram.output_pipeline import (
@@ -21,6 +20,7 @@ from src.telegram.output_pipeline import (
 )
 from src.telegram.output_processor import _CONTENT_STATES
 from src.telegram.output_state import (
+    ContentDeduplicator,
     _states as _session_states,
     cleanup as _cleanup_state,
     get_or_create as _get_or_create,
@@ -177,17 +177,13 @@ class TestContentDedup:
         """
         from src.telegram.formatter import reflow_text
 
-        new_lines = []
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if not stripped:
-                new_lines.append(line)
-            elif stripped not in sent:
-                new_lines.append(line)
-        for line in content.split("\n"):
-            stripped = line.strip()
-            if stripped:
-                sent.add(stripped)
+        lines = content.split("\n")
+        stripped_lines = [line.strip() for line in lines]
+        new_lines = [
+            line for line, stripped in zip(lines, stripped_lines)
+            if not stripped or stripped not in sent
+        ]
+        sent.update(filter(None, stripped_lines))
         if new_lines:
             return reflow_text("\n".join(new_lines)), sent
         return "", sent
@@ -351,7 +347,6 @@ class TestPollOutputIntegration:
         """Remove session state created during tests."""
         _cleanup_state(*key)
 
-    @pytest.mark.asyncio
     async def test_lazy_init_creates_all_state(self):
         """First poll cycle for a session must create emulator, streaming, state, and sent set."""
         key = (777, 1)
@@ -383,7 +378,6 @@ class TestPollOutputIntegration:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_state_change_logged_at_debug(self):
         """State changes should be logged at DEBUG level."""
         key = (775, 1)
@@ -418,7 +412,6 @@ class TestPollOutputStateTransitions:
         """Remove session state created during tests."""
         _cleanup_state(*key)
 
-    @pytest.mark.asyncio
     async def test_thinking_transition_sends_notification(self):
         """UNKNOWN->THINKING must call start_thinking (send_chat_action + send_message)."""
         key = (770, 1)
@@ -452,7 +445,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_streaming_extracts_and_deduplicates_content(self):
         """STREAMING state must extract content, dedup, and edit message in-place."""
         key = (769, 1)
@@ -500,7 +492,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_streaming_filters_already_sent_lines(self):
         """Lines already in sent set must not appear in edited message."""
         key = (768, 1)
@@ -545,7 +536,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_idle_transition_reseeds_dedup_and_finalizes(self):
         """STREAMING->IDLE must re-seed dedup with display and finalize.
 
@@ -597,7 +587,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_tool_request_after_idle_no_content_leak(self):
         """Regression: old response content must not leak into TOOL_REQUEST.
 
@@ -659,7 +648,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_thinking_to_idle_extracts_fast_response_from_display(self):
         """Regression: fast response completing within one poll cycle (THINKING→IDLE).
 
@@ -732,7 +720,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_thinking_snapshot_filters_banner_artifacts_on_fast_idle(self):
         """Regression: banner artifacts ('u') and progress bar must not leak into fast-IDLE content.
 
@@ -803,7 +790,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_thinking_unknown_idle_still_extracts_response(self):
         """Regression: THINKING→UNKNOWN→IDLE must still extract the response.
 
@@ -875,7 +861,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_ultra_fast_response_no_thinking_detected(self):
         """Regression: response completing within a single poll cycle (UNKNOWN→IDLE).
 
@@ -947,7 +932,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_unchanged_state_logged_at_trace(self):
         """Same state on consecutive cycles should log at TRACE, not DEBUG."""
         key = (766, 1)
@@ -980,7 +964,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_streaming_empty_content_not_appended(self):
         """STREAMING with empty extract_content should not call edit_message_text."""
         key = (765, 1)
@@ -1022,7 +1005,6 @@ class TestPollOutputStateTransitions:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_tool_request_sends_inline_keyboard(self):
         """Regression: TOOL_REQUEST must send an inline keyboard, not plain text.
 
@@ -1098,7 +1080,6 @@ class TestPollOutputStreaming:
         """Remove session state created during tests."""
         _cleanup_state(*key)
 
-    @pytest.mark.asyncio
     async def test_thinking_starts_streaming_message(self):
         """THINKING transition must call start_thinking on StreamingMessage."""
         key = (700, 1)
@@ -1132,7 +1113,6 @@ class TestPollOutputStreaming:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_content_uses_format_html(self):
         """Content must flow through format_html before append_content."""
         key = (699, 1)
@@ -1177,7 +1157,6 @@ class TestPollOutputStreaming:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_idle_calls_finalize(self):
         """IDLE transition must call finalize on StreamingMessage."""
         key = (698, 1)
@@ -1219,7 +1198,6 @@ class TestPollOutputStreaming:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_edit_rate_limit_passed_to_streaming(self):
         """poll_output must pass edit_rate_limit to StreamingMessage."""
         key = (690, 1)
@@ -1562,6 +1540,13 @@ class TestDisplayTrimToLastPrompt:
         assert "Previous response" not in content
 
 
+def _snapshot(display: list[str]) -> set[str]:
+    """Return the chrome snapshot ContentDeduplicator takes on THINKING entry."""
+    dedup = ContentDeduplicator()
+    dedup.snapshot_chrome(display)
+    return dedup.thinking_snapshot
+
+
 class TestThinkingSnapshotChromeOnly:
     """Regression: thinking snapshot captured content lines (Args:, Returns:,
     code) from a previous response still visible on the pyte screen.  When
@@ -1585,11 +1570,7 @@ class TestThinkingSnapshotChromeOnly:
             "❯ Write a palindrome function",
             "✶ Assimilating human knowledge…",
         ]
-        snap = set()
-        for line in display_at_thinking:
-            stripped = line.strip()
-            if stripped and classify_text_line(line) in CHROME_CATEGORIES:
-                snap.add(stripped)
+        snap = _snapshot(display_at_thinking)
         assert "Args:" not in snap
         assert "Returns:" not in snap
         assert "def fibonacci(n: int) -> int:" not in snap
@@ -1604,11 +1585,7 @@ class TestThinkingSnapshotChromeOnly:
             "project │ ⎇ main │ Usage: 34%",
             "PR #5",
         ]
-        snap = set()
-        for line in display_at_thinking:
-            stripped = line.strip()
-            if stripped and classify_text_line(line) in CHROME_CATEGORIES:
-                snap.add(stripped)
+        snap = _snapshot(display_at_thinking)
         assert any("palindrome" in s for s in snap)  # prompt
         assert any("────" in s for s in snap)  # separator
         assert any("Assimilating" in s for s in snap)  # thinking star
@@ -1622,11 +1599,7 @@ class TestThinkingSnapshotChromeOnly:
             "❯ Next prompt",
             "✶ Launching Skynet initiative…",
         ]
-        snap = set()
-        for line in display_at_thinking:
-            stripped = line.strip()
-            if stripped and classify_text_line(line) in CHROME_CATEGORIES:
-                snap.add(stripped)
+        snap = _snapshot(display_at_thinking)
         assert not any("⏺" in s for s in snap)
         assert not any("⎿" in s for s in snap)
 
@@ -1661,11 +1634,7 @@ class TestThinkingSnapshotChromeOnly:
             "✢ Initiating singularity sequence…",
             "███▌░░░░░░ ↻ 10:59",
         ]
-        snap = set()
-        for line in display_at_thinking:
-            stripped = line.strip()
-            if stripped and classify_text_line(line) in CHROME_CATEGORIES:
-                snap.add(stripped)
+        snap = _snapshot(display_at_thinking)
         # These MUST NOT be in the snap
         assert "Args:" not in snap
         assert "Returns:" not in snap
@@ -2037,7 +2006,6 @@ class TestDedentAttrLines:
 class TestStartupMessage:
     """Startup must send an informational message to all authorized users."""
 
-    @pytest.mark.asyncio
     async def test_on_startup_sends_message_to_authorized_users(self):
         """_on_startup must send a message to every authorized user."""
         from src.main import _on_startup
@@ -2072,7 +2040,6 @@ class TestStartupMessage:
 class TestShutdownMessage:
     """Shutdown must send a message to all authorized users."""
 
-    @pytest.mark.asyncio
     async def test_send_shutdown_message(self):
         """_send_shutdown_message notifies all authorized users."""
         from src.main import _send_shutdown_message
@@ -2102,7 +2069,6 @@ class TestAnsiReRenderOnCompletion:
     def _cleanup_session(self, key):
         _cleanup_state(*key)
 
-    @pytest.mark.asyncio
     async def test_streaming_idle_uses_ansi_pipeline(self):
         """STREAMING->IDLE must call classify_regions for final render."""
         key = (750, 1)
@@ -2161,7 +2127,6 @@ class TestPollOutputExceptionResilience:
     def _cleanup_session(self, key):
         _cleanup_state(*key)
 
-    @pytest.mark.asyncio
     async def test_poll_loop_survives_per_session_exception(self):
         """Regression test for issue 011: exception in one session must not kill the poll loop.
 
@@ -2210,7 +2175,6 @@ class TestPollOutputExceptionResilience:
         # The loop survived the exception and ran a second cycle before CancelledError.
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_tool_request_with_none_question(self):
         """Regression test for issue 011: TOOL_REQUEST with question=None must not crash.
 
@@ -2269,7 +2233,6 @@ class TestPollOutputExceptionResilience:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_cancelled_error_propagates_through_exception_handler(self):
         """CancelledError must not be swallowed by the per-session exception handler."""
         key = (782, 1)
@@ -2310,7 +2273,6 @@ class TestPollOutputAuthRequired:
     def _cleanup_session(self, key):
         _cleanup_state(*key)
 
-    @pytest.mark.asyncio
     async def test_auth_screen_sends_notification_and_kills_session(self):
         """Regression test for issue 012: when Claude Code shows an OAuth login
         screen, the bot must send a notification to the user and kill the session
@@ -2366,7 +2328,6 @@ class TestPollOutputAuthRequired:
 
         self._cleanup_session(key)
 
-    @pytest.mark.asyncio
     async def test_auth_notification_sent_only_once(self):
         """AUTH_REQUIRED notification must fire only on the first detection,
         not on every poll cycle.
@@ -2508,7 +2469,6 @@ class TestStaleToolRequestOverride:
             )
         assert event.state == ScreenState.TOOL_REQUEST
 
-    @pytest.mark.asyncio
     async def test_poll_output_overrides_stale_tool_request(self):
         """Regression: full poll_output integration — stale TOOL_REQUEST after
         callback must not re-send keyboard and must allow next state through.
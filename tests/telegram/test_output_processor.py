@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.parsing.models import ScreenEvent, ScreenState
 from src.telegram.output_processor import (
     ExtractionMode,
@@ -168,7 +166,6 @@ class TestExtractionModeLogic:
 class TestHandleStateEntry:
     """_handle_state_entry runs pre-extraction side effects."""
 
-    @pytest.mark.asyncio
     async def test_startup_seeds_dedup(self):
         state = _make_state(prev=ScreenState.STARTUP)
         proc = _make_processor(state=state)
@@ -177,7 +174,6 @@ class TestHandleStateEntry:
         await proc._handle_state_entry(event, ScreenState.STARTUP, display)
         assert "Banner line" in state.dedup.sent_lines
 
-    @pytest.mark.asyncio
     async def test_user_message_clears_dedup(self):
         state = _make_state()
         state.dedup.sent_lines.add("old")
@@ -188,7 +184,6 @@ class TestHandleStateEntry:
         assert len(state.dedup.sent_lines) == 0
         assert len(state.dedup.thinking_snapshot) == 0
 
-    @pytest.mark.asyncio
     async def test_thinking_entry_starts_typing(self):
         state = _make_state(prev=ScreenState.IDLE)
         proc = _make_processor(state=state)
@@ -198,7 +193,6 @@ class TestHandleStateEntry:
         )
         state.streaming.start_thinking.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_thinking_entry_snapshots_chrome(self):
         state = _make_state(prev=ScreenState.IDLE)
         proc = _make_processor(state=state)
@@ -208,7 +202,6 @@ class TestHandleStateEntry:
         )
         assert "────────────────────" in state.dedup.thinking_snapshot
 
-    @pytest.mark.asyncio
     async def test_auth_required_kills_session(self):
         state = _make_state()
         proc = _make_processor(state=state)
@@ -219,7 +212,6 @@ class TestHandleStateEntry:
         assert result is True
         proc.session_manager.kill_session.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_tool_request_sends_keyboard(self):
         state = _make_state()
         proc = _make_processor(state=state)
@@ -241,7 +233,6 @@ class TestHandleStateEntry:
 class TestFinalizeResponse:
     """_finalize_response runs post-extraction finalization."""
 
-    @pytest.mark.asyncio
     async def test_reseeds_dedup(self):
         state = _make_state()
         proc = _make_processor(state=state)
@@ -253,7 +244,6 @@ class TestFinalizeResponse:
         await proc._finalize_response(False, display, emu, streaming)
         assert "Some content" in state.dedup.sent_lines
 
-    @pytest.mark.asyncio
     async def test_clears_history_and_finalizes(self):
         state = _make_state()
         proc = _make_processor(state=state)
@@ -265,7 +255,6 @@ class TestFinalizeResponse:
         emu.clear_history.assert_called_once()
         streaming.finalize.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_skips_rerender_after_fast_idle(self):
         state = _make_state()
         proc = _make_processor(state=state)
@@ -277,7 +266,6 @@ class TestFinalizeResponse:
         # Should NOT call get_full_display (re-render skipped)
         emu.get_full_display.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_ansi_rerender_when_not_fast_idle(self):
         state = _make_state()
         proc = _make_processor(state=state)
@@ -298,7 +286,6 @@ class TestFinalizeResponse:
 class TestExtractAndSend:
     """_extract_and_send covers all extraction branches."""
 
-    @pytest.mark.asyncio
     async def test_fast_idle_with_prompt_found(self):
         """FAST_IDLE with find_last_prompt returning an index slices source."""
         state = _make_state()
@@ -329,7 +316,6 @@ class TestExtractAndSend:
         streaming.append_content.assert_called_once()
         emu.clear_history.assert_called()
 
-    @pytest.mark.asyncio
     async def test_extract_returns_empty_content(self):
         """Early return when extract_content produces nothing."""
         state = _make_state()
@@ -344,7 +330,6 @@ class TestExtractAndSend:
             )
         streaming.append_content.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_dedup_returns_empty(self):
         """Early return when dedup filters everything out."""
         state = _make_state()
@@ -365,7 +350,6 @@ class TestExtractAndSend:
 class TestProcessCycle:
     """Integration test for process_cycle."""
 
-    @pytest.mark.asyncio
     async def test_processes_raw_bytes(self):
         state = _make_state(prev=ScreenState.IDLE)
         proc = _make_processor(state=state)
@@ -385,7 +369,6 @@ class TestProcessCycle:
 class TestProcessCycleIntegration:
     """End-to-end test using real TerminalEmulator (no pipeline mocks)."""
 
-    @pytest.mark.asyncio
     async def test_streaming_content_reaches_telegram(self):
         """Real emulator + real pipeline: streaming text produces HTML output."""
         from src.parsing.terminal_emulator import TerminalEmulator
@@ -6,8 +6,6 @@ import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.telegram.streaming_message import StreamingMessage, StreamingState
 
 
@@ -25,7 +23,6 @@ class TestStreamingMessageInit:
 class TestStreamingMessageThinking:
     """start_thinking() must send typing action and placeholder."""
 
-    @pytest.mark.asyncio
     async def test_sends_typing_action(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -33,7 +30,6 @@ class TestStreamingMessageThinking:
         await sm.start_thinking()
         bot.send_chat_action.assert_called_once_with(chat_id=123, action="typing")
 
-    @pytest.mark.asyncio
     async def test_sends_placeholder_message(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -43,7 +39,6 @@ class TestStreamingMessageThinking:
             chat_id=123, text="<i>Thinking...</i>", parse_mode="HTML"
         )
 
-    @pytest.mark.asyncio
     async def test_stores_message_id(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -52,7 +47,6 @@ class TestStreamingMessageThinking:
         assert sm.message_id == 42
         assert sm.state == StreamingState.THINKING
 
-    @pytest.mark.asyncio
     async def test_starts_typing_loop(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -70,7 +64,6 @@ class TestStreamingMessageThinking:
 class TestStreamingMessageAppendContent:
     """append_content() must edit message with accumulated HTML."""
 
-    @pytest.mark.asyncio
     async def test_first_content_cancels_typing(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -86,7 +79,6 @@ class TestStreamingMessageAppendContent:
             pass
         assert typing_task.cancelled()
 
-    @pytest.mark.asyncio
     async def test_accumulates_content(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -97,7 +89,6 @@ class TestStreamingMessageAppendContent:
         await sm.append_content("World")
         assert sm.accumulated == "Hello World"
 
-    @pytest.mark.asyncio
     async def test_edits_message_when_throttle_allows(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -109,7 +100,6 @@ class TestStreamingMessageAppendContent:
             chat_id=123, message_id=42, text="Hello", parse_mode="HTML"
         )
 
-    @pytest.mark.asyncio
     async def test_throttles_edits(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -120,7 +110,6 @@ class TestStreamingMessageAppendContent:
         bot.edit_message_text.assert_not_called()
         assert sm.accumulated == "Hello"
 
-    @pytest.mark.asyncio
     async def test_state_transitions_to_streaming(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -134,7 +123,6 @@ class TestStreamingMessageAppendContent:
 class TestStreamingMessageOverflow:
     """Content exceeding 4096 chars must trigger overflow."""
 
-    @pytest.mark.asyncio
     async def test_overflow_splits_at_newline(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=99)
@@ -147,7 +135,6 @@ class TestStreamingMessageOverflow:
         bot.edit_message_text.assert_called()
         assert bot.send_message.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_overflow_continues_with_remainder(self):
         bot = AsyncMock()
         new_msg = MagicMock(message_id=99)
@@ -164,7 +151,6 @@ class TestStreamingMessageOverflow:
 class TestStreamingMessageFinalize:
     """finalize() must send final edit and reset state."""
 
-    @pytest.mark.asyncio
     async def test_finalize_sends_final_edit(self):
         bot = AsyncMock()
         sm = StreamingMessage(bot=bot, chat_id=123, edit_rate_limit=3)
@@ -176,7 +162,6 @@ class TestStreamingMessageFinalize:
             chat_id=123, message_id=42, text="Final content", parse_mode="HTML"
         )
 
-    @pytest.mark.asyncio
     async def test_finalize_resets_state(self):
         bot = AsyncMock()
         sm = StreamingMessage(bot=bot, chat_id=123, edit_rate_limit=3)
@@ -188,7 +173,6 @@ class TestStreamingMessageFinalize:
         assert sm.message_id is None
         assert sm.accumulated == ""
 
-    @pytest.mark.asyncio
     async def test_finalize_cancels_typing_task(self):
         bot = AsyncMock()
         bot.send_message.return_value = MagicMock(message_id=42)
@@ -203,7 +187,6 @@ class TestStreamingMessageFinalize:
             pass
         assert typing_task.cancelled()
 
-    @pytest.mark.asyncio
     async def test_finalize_noop_when_empty(self):
         bot = AsyncMock()
         sm = StreamingMessage(bot=bot, chat_id=123, edit_rate_limit=3)
@@ -214,7 +197,6 @@ class TestStreamingMessageFinalize:
 class TestStreamingMessageEdgeErrors:
     """Error handling in StreamingMessage."""
 
-    @pytest.mark.asyncio
     async def test_edit_failure_logged_not_raised(self):
         from telegram.error import NetworkError
 
@@ -227,7 +209,6 @@ class TestStreamingMessageEdgeErrors:
         await sm.append_content("Hello")
         assert sm.accumulated == "Hello"
 
-    @pytest.mark.asyncio
     async def test_html_fallback_on_parse_error(self):
         from telegram.error import BadRequest
 
@@ -246,7 +227,6 @@ class TestStreamingMessageEdgeErrors:
         assert second_call.kwargs.get("parse_mode") is None
 
 
-    @pytest.mark.asyncio
     async def test_message_not_modified_suppressed(self):
         """'Message is not modified' error must be silently suppressed."""
         from telegram.error import BadRequest
@@ -268,7 +248,6 @@ class TestStreamingMessageEdgeErrors:
 class TestStreamingMessageSafetyNets:
     """Safety nets: auto-finalize on re-entry and auto-create on missing thinking."""
 
-    @pytest.mark.asyncio
     async def test_start_thinking_auto_finalizes_if_streaming(self):
         """start_thinking() while still STREAMING must finalize previous response."""
         bot = AsyncMock()
@@ -289,7 +268,6 @@ class TestStreamingMessageSafetyNets:
         assert sm.message_id == 42
         assert sm.state == StreamingState.THINKING
 
-    @pytest.mark.asyncio
     async def test_append_content_creates_message_if_idle(self):
         """append_content() while IDLE (no start_thinking) must send a new message."""
         bot = AsyncMock()
@@ -307,7 +285,6 @@ class TestStreamingMessageSafetyNets:
         assert sm.state == StreamingState.STREAMING
         assert sm.accumulated == "Direct content"
 
-    @pytest.mark.asyncio
     async def test_append_content_creates_message_if_message_id_none(self):
         """append_content() with None message_id must send a new message."""
         bot = AsyncMock()
@@ -321,7 +298,6 @@ class TestStreamingMessageSafetyNets:
         bot.send_message.assert_called_once()
         assert sm.message_id == 66
 
-    @pytest.mark.asyncio
     async def test_start_thinking_from_idle_no_finalize(self):
         """start_thinking() from IDLE should NOT call finalize (nothing to finalize)."""
         bot = AsyncMock()
@@ -339,7 +315,6 @@ class TestStreamingMessageSafetyNets:
 class TestEditEdgeCases:
     """Cover _edit edge cases: early return, parse error fallback failure."""
 
-    @pytest.mark.asyncio
     async def test_edit_noop_when_no_message_id(self):
         """_edit returns immediately when message_id is None."""
         bot = AsyncMock()
@@ -349,7 +324,6 @@ class TestEditEdgeCases:
         await sm._edit()
         bot.edit_message_text.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_edit_noop_when_no_accumulated(self):
         """_edit returns immediately when accumulated is empty."""
         bot = AsyncMock()
@@ -359,7 +333,6 @@ class TestEditEdgeCases:
         await sm._edit()
         bot.edit_message_text.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_edit_plain_fallback_also_fails(self):
         """When HTML parse fails and plain-text fallback also fails, logs warning."""
         from telegram.error import BadRequest
@@ -382,7 +355,6 @@ class TestEditEdgeCases:
 class TestOverflowEdgeCases:
     """Cover _overflow when no newline found in first 4096 chars."""
 
-    @pytest.mark.asyncio
     async def test_overflow_no_newline_splits_at_4000(self):
         """When no newline in first 4096 chars, splits at 4000."""
         bot = AsyncMock()
@@ -401,7 +373,6 @@ class TestOverflowEdgeCases:
 class TestTypingLoop:
     """Cover _typing_loop send_chat_action and cancellation."""
 
-    @pytest.mark.asyncio
     async def test_typing_loop_sends_action_and_cancels(self):
         """_typing_loop sends typing action, then catches CancelledError."""
         bot = AsyncMock()
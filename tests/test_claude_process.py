@@ -9,7 +9,6 @@ from src.claude_process import ClaudeProcess
 
 
 class TestClaudeProcess:
-    @pytest.mark.asyncio
     async def test_spawn_and_read(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         await proc.spawn()
@@ -20,7 +19,6 @@ class TestClaudeProcess:
         assert "hello" in output
         await proc.terminate()
 
-    @pytest.mark.asyncio
     async def test_terminate(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         await proc.spawn()
@@ -28,7 +26,6 @@ class TestClaudeProcess:
         await proc.terminate()
         assert not proc.is_alive()
 
-    @pytest.mark.asyncio
     async def test_exit_code_after_terminate(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         await proc.spawn()
@@ -36,7 +33,6 @@ class TestClaudeProcess:
         exit_code = proc.exit_code()
         assert exit_code is not None
 
-    @pytest.mark.asyncio
     async def test_write_to_terminated_process(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         await proc.spawn()
@@ -44,7 +40,6 @@ class TestClaudeProcess:
         # Should not raise
         await proc.write("hello\n")
 
-    @pytest.mark.asyncio
     async def test_read_from_empty_buffer(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         await proc.spawn()
@@ -52,7 +47,6 @@ class TestClaudeProcess:
         assert isinstance(output, str)
         await proc.terminate()
 
-    @pytest.mark.asyncio
     async def test_read_after_terminate_no_warning(self):
         """Regression: read_available after terminate must not log a warning."""
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
@@ -62,7 +56,6 @@ class TestClaudeProcess:
         output = proc.read_available()
         assert output == ""
 
-    @pytest.mark.asyncio
     async def test_cwd_is_set(self, tmp_path):
         proc = ClaudeProcess(command="pwd", args=[], cwd=str(tmp_path))
         await proc.spawn()
@@ -70,22 +63,18 @@ class TestClaudeProcess:
         output = proc.read_available()
         assert str(tmp_path) in output or "tmp" in output
 
-    @pytest.mark.asyncio
     async def test_not_spawned_is_not_alive(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         assert not proc.is_alive()
 
-    @pytest.mark.asyncio
     async def test_read_before_spawn(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         assert proc.read_available() == ""
 
-    @pytest.mark.asyncio
     async def test_exit_code_before_spawn(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         assert proc.exit_code() is None
 
-    @pytest.mark.asyncio
     async def test_spawn_with_args(self):
         proc = ClaudeProcess(command="echo", args=["hello", "world"], cwd="/tmp")
         await proc.spawn()
@@ -127,7 +116,6 @@ class TestBuildEnv:
 
 
 class TestSubmit:
-    @pytest.mark.asyncio
     async def test_submit_sends_text_then_cr(self):
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
         await proc.spawn()
@@ -138,7 +126,6 @@ class TestSubmit:
         assert "hello" in output
         await proc.terminate()
 
-    @pytest.mark.asyncio
     async def test_submit_calls_write_twice(self):
         """submit() must send text and \\r as two separate writes."""
         proc = ClaudeProcess(command="cat", args=[], cwd="/tmp")
@@ -152,8 +139,8 @@ class TestSubmit:
         assert calls[1] == "\r"
 
 
+@pytest.mark.usefixtures("restore_logging")
 class TestClaudeProcessLogging:
-    @pytest.mark.asyncio
     async def test_spawn_logs_command(self, caplog):
         from src.core.log_setup import setup_logging
         setup_logging(debug=True, trace=False, verbose=False)
@@ -29,7 +29,7 @@ class TestLoadConfig:
         }))
         config = load_config(str(config_file))
         assert config.telegram.bot_token == "test-token-123"
-        assert config.telegram.authorized_users == [111, 222]
+        assert config.telegram.authorized_users == frozenset({111, 222})
         assert config.projects.root == "/tmp/projects"
         assert config.sessions.max_per_user == 3
         assert config.claude.command == "claude"
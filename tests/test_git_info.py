@@ -3,8 +3,6 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from src.git_info import GitInfo, get_git_info
 
 
@@ -68,7 +66,6 @@ class TestGitInfo:
 
 
 class TestGetGitInfo:
-    @pytest.mark.asyncio
     async def test_returns_branch_name(self):
         with patch("src.git_info._run_command", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
@@ -78,7 +75,6 @@ class TestGetGitInfo:
             info = await get_git_info("/some/project")
             assert info.branch == "feature/my-branch"
 
-    @pytest.mark.asyncio
     async def test_returns_pr_info(self):
         pr_json = json.dumps({
             "url": "https://github.com/user/repo/pull/42",
@@ -95,7 +91,6 @@ class TestGetGitInfo:
             assert info.pr_title == "My PR title"
             assert info.pr_state == "OPEN"
 
-    @pytest.mark.asyncio
     async def test_no_pr(self):
         with patch("src.git_info._run_command", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = ["main", ""]
@@ -104,7 +99,6 @@ class TestGetGitInfo:
             assert info.pr_url is None
             assert info.pr_title is None
 
-    @pytest.mark.asyncio
     async def test_git_command_fails(self):
         with patch("src.git_info._run_command", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = Exception("git not found")
@@ -112,7 +106,6 @@ class TestGetGitInfo:
             assert info.branch is None
             assert info.pr_url is None
 
-    @pytest.mark.asyncio
     async def test_gh_command_fails_still_returns_branch(self):
         with patch("src.git_info._run_command", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = [
@@ -123,14 +116,12 @@ class TestGetGitInfo:
             assert info.branch == "main"
             assert info.pr_url is None
 
-    @pytest.mark.asyncio
     async def test_empty_branch_becomes_none(self):
         with patch("src.git_info._run_command", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = ["", ""]
             info = await get_git_info("/some/project")
             assert info.branch is None
 
-    @pytest.mark.asyncio
     async def test_invalid_pr_json(self):
         with patch("src.git_info._run_command", new_callable=AsyncMock) as mock_run:
             mock_run.side_effect = ["main", "not valid json"]
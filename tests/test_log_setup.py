@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 from unittest.mock import patch
 
+import pytest
+
 from src.core.log_setup import TRACE, setup_logging
 
 
@@ -20,6 +22,7 @@ class TestTraceLevel:
         assert callable(logger.trace)
 
 
+@pytest.mark.usefixtures("restore_logging")
 class TestSetupLogging:
     def test_default_console_info(self):
         root = setup_logging(debug=False, trace=False, verbose=False)
@@ -3,9 +3,8 @@ from __future__ import annotations
 import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from src.main import _on_startup, _parse_args
+from tests.conftest import make_config
 
 
 class TestOnStartup:
@@ -22,7 +21,6 @@ class TestOnStartup:
         app.bot.send_message = AsyncMock()
         return app
 
-    @pytest.mark.asyncio
     async def test_initializes_db_and_marks_lost(self):
         db = AsyncMock()
         db.initialize = AsyncMock()
@@ -34,7 +32,6 @@ class TestOnStartup:
         db.initialize.assert_called_once()
         db.mark_active_sessions_lost.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_no_lost_sessions(self):
         db = AsyncMock()
         db.initialize = AsyncMock()
@@ -43,7 +40,6 @@ class TestOnStartup:
         await _on_startup(app)
         db.initialize.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_sets_bot_commands(self):
         db = AsyncMock()
         db.initialize = AsyncMock()
@@ -84,22 +80,11 @@ class TestParseArgs:
 class TestBuildApp:
     """Regression: build_app must wire all components correctly."""
 
-    def test_env_threaded_to_session_manager(self, tmp_path):
+    def test_env_threaded_to_session_manager(self):
         """Regression: claude.env from config must reach SessionManager and ClaudeProcess."""
-        config_file = tmp_path / "test.yaml"
-        config_file.write_text(
-            "telegram:\n"
-            "  bot_token: 'test-token'\n"
-            "  authorized_users: [111]\n"
-            "projects:\n"
-            "  root: /tmp\n"
-            "claude:\n"
-            "  env:\n"
-            "    MY_CUSTOM_VAR: 'some-value'\n"
-        )
-        from src.main import build_app
+        from src.main import build_app_from_config
 
-        app = build_app(str(config_file))
+        app = build_app_from_config(make_config(env={"MY_CUSTOM_VAR": "some-value"}))
         sm = app.bot_data["session_manager"]
         assert sm._env == {"MY_CUSTOM_VAR": "some-value"}
 
@@ -132,7 +117,6 @@ class TestBuildApp:
 class TestGracefulShutdown:
     """Regression: shutdown must terminate sessions and close db."""
 
-    @pytest.mark.asyncio
     async def test_shutdown_calls_session_shutdown_and_db_close(self):
         """Regression: main shutdown sequence must terminate all sessions then close db."""
         session_manager = AsyncMock()
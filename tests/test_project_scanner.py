@@ -1,6 +1,8 @@
 # tests/test_project_scanner.py
 import logging
 
+import pytest
+
 from src.project_scanner import scan_projects, Project
 
 
@@ -65,6 +67,7 @@ class TestProject:
         assert "foo" in repr(p)
 
 
+@pytest.mark.usefixtures("restore_logging")
 class TestScanProjectsLogging:
     def test_logs_root_and_count(self, tmp_projects, caplog):
         from src.core.log_setup import setup_logging
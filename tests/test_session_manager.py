@@ -42,7 +42,6 @@ def _mock_process():
 
 
 class TestSessionManager:
-    @pytest.mark.asyncio
     async def test_create_session(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -53,7 +52,6 @@ class TestSessionManager:
             assert session.project_name == "proj"
             assert session.status == "active"
 
-    @pytest.mark.asyncio
     async def test_session_limit_enforced(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -65,7 +63,6 @@ class TestSessionManager:
             with pytest.raises(SessionError, match="limit"):
                 await manager.create_session(111, "p4", "/a/p4")
 
-    @pytest.mark.asyncio
     async def test_get_active_session(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -74,11 +71,9 @@ class TestSessionManager:
             assert active is not None
             assert active.session_id == session.session_id
 
-    @pytest.mark.asyncio
     async def test_get_active_session_no_sessions(self, manager):
         assert manager.get_active_session(111) is None
 
-    @pytest.mark.asyncio
     async def test_switch_session(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -90,12 +85,10 @@ class TestSessionManager:
             manager.switch_session(111, s1.session_id)
             assert manager.get_active_session(111).session_id == s1.session_id
 
-    @pytest.mark.asyncio
     async def test_switch_session_not_found(self, manager):
         with pytest.raises(SessionError, match="not found"):
             manager.switch_session(111, 99)
 
-    @pytest.mark.asyncio
     async def test_list_sessions(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -105,11 +98,9 @@ class TestSessionManager:
             sessions = manager.list_sessions(111)
             assert len(sessions) == 2
 
-    @pytest.mark.asyncio
     async def test_list_sessions_empty(self, manager):
         assert manager.list_sessions(111) == []
 
-    @pytest.mark.asyncio
     async def test_kill_session(self, manager, mock_db, mock_file_handler):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -119,7 +110,6 @@ class TestSessionManager:
             mock_db.end_session.assert_called_once()
             mock_file_handler.cleanup_session.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_kill_session_cleans_output_state(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc, \
              patch("src.session_manager._cleanup_output_state") as mock_cleanup:
@@ -128,12 +118,10 @@ class TestSessionManager:
             await manager.kill_session(111, session.session_id)
             mock_cleanup.assert_called_once_with(111, session.session_id)
 
-    @pytest.mark.asyncio
     async def test_kill_session_not_found(self, manager):
         with pytest.raises(SessionError, match="not found"):
             await manager.kill_session(111, 99)
 
-    @pytest.mark.asyncio
     async def test_kill_switches_active(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -147,7 +135,6 @@ class TestSessionManager:
             assert active is not None
             assert active.session_id == s1.session_id
 
-    @pytest.mark.asyncio
     async def test_kill_last_session_clears_active(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -155,7 +142,6 @@ class TestSessionManager:
             await manager.kill_session(111, session.session_id)
             assert manager.get_active_session(111) is None
 
-    @pytest.mark.asyncio
     async def test_different_users_independent(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -165,7 +151,6 @@ class TestSessionManager:
             assert len(manager.list_sessions(111)) == 1
             assert len(manager.list_sessions(222)) == 1
 
-    @pytest.mark.asyncio
     async def test_has_active_sessions(self, manager):
         assert manager.has_active_sessions() is False
         with patch("src.session_manager.ClaudeProcess") as MockProc:
@@ -173,7 +158,6 @@ class TestSessionManager:
             await manager.create_session(111, "proj", "/a/proj")
             assert manager.has_active_sessions() is True
 
-    @pytest.mark.asyncio
     async def test_active_session_count(self, manager):
         assert manager.active_session_count() == 0
         with patch("src.session_manager.ClaudeProcess") as MockProc:
@@ -187,7 +171,6 @@ class TestSessionManager:
 class TestSessionManagerShutdown:
     """Regression: shutdown() must terminate all sessions and clear state."""
 
-    @pytest.mark.asyncio
     async def test_shutdown_terminates_all_sessions(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             proc1 = _mock_process()
@@ -201,7 +184,6 @@ class TestSessionManagerShutdown:
             proc1.terminate.assert_called_once()
             proc2.terminate.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_shutdown_clears_sessions(self, manager):
         with patch("src.session_manager.ClaudeProcess") as MockProc:
             MockProc.return_value = _mock_process()
@@ -213,7 +195,6 @@ class TestSessionManagerShutdown:
             assert manager.get_active_session(111) is None
             assert manager.active_session_count() == 0
 
-    @pytest.mark.asyncio
     async def test_shutdown_empty_is_noop(self, manager):
         # Should not raise when no sessions exist
         await manager.shutdown()
@@ -252,9 +233,17 @@ class TestOutputBuffer:
         buf = OutputBuffer(debounce_ms=100, max_buffer=2000)
         assert buf.is_ready() is False
 
+    def test_empty_append_keeps_debounce_timer(self):
+        buf = OutputBuffer(debounce_ms=100, max_buffer=2000)
+        buf.append("data")
+        started = buf._last_append
+        buf.append("")
+        assert buf._last_append == started
+        assert buf.flush() == "data"
+
 
+@pytest.mark.usefixtures("restore_logging")
 class TestSessionManagerLogging:
-    @pytest.mark.asyncio
     async def test_create_session_logs(self, caplog):
         from src.core.log_setup import setup_logging
         setup_logging(debug=True, trace=False, verbose=False)